@@ -65,15 +65,30 @@ DEADTIME_RANGE = (1, 1000)
 BAUD_RATES = ["9600", "19200", "38400", "57600", "115200", "230400", "460800", "921600"]
 DEFAULT_BAUD = "115200"
 
-SERIAL_POLL_INTERVAL_MS = 150  # timer interval for reading serial data
 SERIAL_READ_TIMEOUT = 0.1  # serial.Serial timeout (seconds)
+TERMINAL_MAX_BLOCKS = 5000  # terminal output keeps only the newest N lines
+LOG_MAX_BLOCKS = 5000  # event/fault log, same pruning
+SWEEP_LOG_MAX_BLOCKS = 5000  # sweep results log, same pruning
+
+# ---------------------------------------------------------------------------
+# Appearance
+# ---------------------------------------------------------------------------
+# Use Qt's Fusion style so the dark palette applies on every platform; set to
+# False to keep the native Windows/macOS style (which may ignore some
+# palette colors, e.g. slider and check-box fills).
+UI_FUSION_STYLE = True
 
 # ---------------------------------------------------------------------------
 # Polling intervals (ms)
 # ---------------------------------------------------------------------------
-FAULT_POLL_INTERVAL_MS = 3000
-ARM_STATE_POLL_INTERVAL_MS = 700
+STATUS_POLL_INTERVAL_MS = 700  # combined arm-state / fault poll
+STATUS_POLL_MAX_INTERVAL_MS = 2800  # backoff ceiling while the state is steady
+STATUS_POLL_IDLE_POLLS = 5  # unchanged polls before the interval starts doubling
+FAULT_POLL_INTERVAL_MS = 3000  # faults are re-read at least this often while polling
+FAULT_CACHE_TTL_S = 0.25  # reuse an automatic fault read younger than this
 API_OPERATION_TIMEOUT_MS = 5000
+SLIDER_DEBOUNCE_MS = 100  # settle time before voltage-dependent PW limits update
+UI_FLUSH_INTERVAL_MS = 50  # queued terminal RX / worker logs reach the views at most this often
 
 # ---------------------------------------------------------------------------
 # Sweep defaults
@@ -98,12 +113,16 @@ SWEEP_PULSES_PER_POINT = 5
 SWEEP_PULSE_REPEAT = 1
 SWEEP_PULSE_INTERVAL = 1000  # milliseconds between pulses within a point
 SWEEP_DEADTIME = 10
+SWEEP_ARM_SETTLE_TIMEOUT_S = 3.0  # max wait for "armed" after arming a point
+SWEEP_ARM_CHARGE_DWELL_S = 1.2  # min HV charge time after the arm write, before pulsing
 SWEEP_EXPECTED_CT = ""
+SWEEP_AUTOSAVE_DIR = "sweep_results"  # incremental per-sweep CSVs land here
 
 # ---------------------------------------------------------------------------
 # KW45 target protocol marker
 # ---------------------------------------------------------------------------
 KW45_RESET_MARKER = "KW45 Ready. Waiting for commands..."
+KW45_RESET_MARKER_B = KW45_RESET_MARKER.encode()
 
 # ---------------------------------------------------------------------------
 # Repeat-send defaults
@@ -10,10 +10,14 @@ import sys
 from PySide6.QtWidgets import QApplication
 
 from ui.main_window import MainWindow
+from ui.theme import apply_theme
 
 
 def main() -> None:
     app = QApplication(sys.argv)
+    # Install the theme once on the application (parsed once, inherited by
+    # every widget and dialog) rather than on the MainWindow tree.
+    apply_theme(app)
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
@@ -0,0 +1,42 @@
+"""
+Tests for the pure ciphertext helpers of ``workers.sweep_worker``.
+
+Run from the repository root with ``python -m unittest``.
+"""
+
+import unittest
+
+from workers.sweep_worker import SweepWorker
+
+_CT = "3ad77bb40d7a3660a89ecaf32466ef97"  # AES-128 ECB, FIPS-197 key/PT
+
+
+class BitFlipsTest(unittest.TestCase):
+    def test_identical_ciphertexts(self):
+        ct = SweepWorker._normalize_ct(_CT)
+        self.assertEqual(SweepWorker._bit_flips(ct, ct), 0)
+
+    def test_single_bit_in_last_byte(self):
+        ct = SweepWorker._normalize_ct(_CT[:-2] + "96")
+        expected = SweepWorker._normalize_ct(_CT)
+        self.assertEqual(SweepWorker._bit_flips(ct, expected), 1)
+
+    def test_first_byte_inverted(self):
+        ct = SweepWorker._normalize_ct("c5" + _CT[2:])
+        expected = SweepWorker._normalize_ct(_CT)
+        self.assertEqual(SweepWorker._bit_flips(ct, expected), 8)
+
+    def test_all_bits_flipped(self):
+        ct = SweepWorker._normalize_ct("ff" * 16)
+        expected = SweepWorker._normalize_ct("00" * 16)
+        self.assertEqual(SweepWorker._bit_flips(ct, expected), 128)
+
+    def test_case_and_spacing_do_not_matter(self):
+        spaced = " ".join(_CT.upper()[i : i + 2] for i in range(0, 32, 2))
+        ct = SweepWorker._normalize_ct(spaced)
+        expected = SweepWorker._normalize_ct(_CT)
+        self.assertEqual(SweepWorker._bit_flips(ct, expected), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
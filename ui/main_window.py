@@ -7,7 +7,10 @@ UI construction lives in the panels.  This class is the "controller"
 that ties them together.
 """
 
+import os
+import re
 import time
+from collections.abc import Iterator
 
 from PySide6.QtWidgets import (
     QDockWidget,
@@ -17,20 +20,22 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
-from PySide6.QtCore import Qt, QThread, QTimer
-from PySide6.QtGui import QTextCursor, QResizeEvent
+from PySide6.QtCore import QEvent, Qt, QThread, QTimer
+from PySide6.QtGui import QTextCursor, QTextDocument, QResizeEvent
 
 from config import (
     APP_MIN_HEIGHT,
     APP_MIN_WIDTH,
     APP_TITLE,
     API_OPERATION_TIMEOUT_MS,
-    ARM_STATE_POLL_INTERVAL_MS,
-    FAULT_POLL_INTERVAL_MS,
     PROBE_LIMITS,
-    SERIAL_POLL_INTERVAL_MS,
+    SLIDER_DEBOUNCE_MS,
+    STATUS_POLL_IDLE_POLLS,
+    STATUS_POLL_INTERVAL_MS,
+    STATUS_POLL_MAX_INTERVAL_MS,
+    SWEEP_AUTOSAVE_DIR,
+    UI_FLUSH_INTERVAL_MS,
 )
-from ui.theme import DARK_THEME_QSS
 from ui.panels.basic_panel import BasicPanel
 from ui.panels.terminal_panel import TerminalPanel
 from ui.panels.sweep_panel import SweepPanel
@@ -38,7 +43,8 @@ from ui.panels.log_panel import LogPanel
 from workers.shouter_worker import ShouterWorker
 from workers.serial_worker import SerialTerminalWorker
 from workers.sweep_worker import SweepWorker
-from utils.serial_utils import refresh_port_combobox
+from workers.port_scanner import PortScanner
+from utils.probe_limits import pw_envelope, pw_limits_for_voltage
 from utils.csv_export import (
     default_filename,
     export_raw_lines_to_csv,
@@ -47,36 +53,73 @@ from utils.csv_export import (
 )
 
 
+# Fault-log line colors.  Alternatives are tried in priority order at the
+# start of the line: any "Error" wins, then real current/latched faults.
+_FAULT_CLASS_RE = re.compile(
+    r"(?P<err>(?=.*Error))"
+    r"|(?P<cur>(?=.*\[CURRENT\])(?!.*No faults))"
+    r"|(?P<lat>(?=.*\[LATCHED\])(?!.*No latched))"
+)
+_FAULT_COLORS = {"err": "darkred", "cur": "red", "lat": "#cc6600"}
+
+# Port owners shown in the port-conflict tooltips and errors
+_OWNER_API = "ChipSHOUTER API"
+_OWNER_TERMINAL = "Serial Terminal"
+
+_ts_cache: tuple[int, str] = (-1, "")
+
+
+def _hhmmss() -> str:
+    """Return the local ``HH:MM:SS`` time, formatted at most once per second."""
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    return _ts_cache[1]
+
+
+def _document_lines(doc: QTextDocument) -> Iterator[str]:
+    """Yield the text of each block of *doc* without copying the whole text."""
+    block = doc.begin()
+    while block.isValid():
+        yield block.text()
+        block = block.next()
+
+
 class MainWindow(QMainWindow):
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle(APP_TITLE)
         self.setMinimumSize(APP_MIN_WIDTH, APP_MIN_HEIGHT)
 
-        # Terminal duplicate filter
-        self.last_terminal_data = ""
-        self.last_terminal_time = 0.0
+        # Terminal duplicate filter (hash of the last chunk + monotonic time)
+        self._last_rx_hash = 0
+        self._last_rx_time = float("-inf")
 
         # UI mutex: track connection states to prevent port conflicts
         self.api_connected = False
         self.api_armed = False
         self.api_busy = False
         self.terminal_connected = False
-        self.api_port: str | None = None
-        self.terminal_port: str | None = None
+        self._port_owner: dict[str, str] = {}  # open port -> _OWNER_API / _OWNER_TERMINAL
         self.pending_api_action: str | None = None
 
+        # Last applied UI state; unchanged states skip restyling / setEnabled
+        self._armed_style: bool | None = None
+        self._button_state: tuple[bool, bool, bool] | None = None
+        self._buttons_refresh_pending = False
+
         # -- Workers & threads --
         self._setup_workers()
 
         # -- Timers --
         self._setup_timers()
 
-        # -- UI --
-        self.setStyleSheet(DARK_THEME_QSS)
+        # -- UI -- (dark theme is installed on the QApplication in main.py)
         self._setup_panels()
         self._setup_connections()
         self._refresh_action_buttons()
+        self._refresh_ports()
 
         # Sweep state
         self.sweep_running = False
@@ -100,23 +143,44 @@ class MainWindow(QMainWindow):
         self.sweep_worker.moveToThread(self.sweep_thread)
         self.sweep_thread.start()
 
-    def _setup_timers(self) -> None:
-        self.serial_timer = QTimer()
-        self.serial_timer.timeout.connect(self.terminal_worker.read_data)
+        # Port enumeration runs on the global QThreadPool
+        self.port_scanner = PortScanner()
 
+    def _setup_timers(self) -> None:
         self.repeat_send_timer = QTimer()
         self.repeat_send_timer.timeout.connect(self._send_repeat_payload)
 
-        self.fault_timer = QTimer()
-        self.fault_timer.timeout.connect(self._poll_faults)
-
-        self.arm_state_timer = QTimer()
-        self.arm_state_timer.timeout.connect(self._poll_arm_state)
+        # One poller for arm state and faults; see ShouterWorker.poll_status.
+        self.status_poll_timer = QTimer()
+        self.status_poll_timer.setInterval(STATUS_POLL_INTERVAL_MS)
+        self.status_poll_timer.timeout.connect(self._poll_status)
+        self._status_idle_polls = 0
 
         self.api_operation_timeout = QTimer(self)
         self.api_operation_timeout.setSingleShot(True)
         self.api_operation_timeout.timeout.connect(self._on_api_operation_timeout)
 
+        # Voltage drags update the PW limits once the slider settles
+        self.pw_limits_timer = QTimer(self)
+        self.pw_limits_timer.setSingleShot(True)
+        self.pw_limits_timer.setTimerType(Qt.PreciseTimer)
+        self.pw_limits_timer.setInterval(SLIDER_DEBOUNCE_MS)
+        self.pw_limits_timer.timeout.connect(self._on_voltage_changed_update_pw_limits)
+
+        # Terminal RX and worker logs are drained together in one flush per
+        # interval, started by the first wake-up after the previous flush
+        self.ui_flush_timer = QTimer(self)
+        self.ui_flush_timer.setSingleShot(True)
+        self.ui_flush_timer.setInterval(UI_FLUSH_INTERVAL_MS)
+        self.ui_flush_timer.timeout.connect(self._flush_ui_queues)
+
+        # Dock proportions are re-applied once per event-loop pass, however
+        # many resize events arrived (e.g. while dragging the window edge)
+        self.dock_resize_timer = QTimer(self)
+        self.dock_resize_timer.setSingleShot(True)
+        self.dock_resize_timer.setInterval(0)
+        self.dock_resize_timer.timeout.connect(self._apply_adaptive_dock_sizes)
+
     def _setup_panels(self) -> None:
         # Central widget (unused but required by QMainWindow)
         central = QWidget()
@@ -147,12 +211,15 @@ class MainWindow(QMainWindow):
         self.addDockWidget(Qt.RightDockWidgetArea, self.dock_terminal)
 
         # --- Sweep Scan (right, tabbed) ---
-        self.sweep = SweepPanel()
+        # The panel is built the first time its tab is shown; see
+        # _ensure_sweep_panel().
+        self.sweep: SweepPanel | None = None
         self.dock_sweep = QDockWidget("Sweep Scan", self)
         self.dock_sweep.setObjectName("dock_sweep")
         self.dock_sweep.setAllowedAreas(Qt.RightDockWidgetArea)
         self.dock_sweep.setFeatures(QDockWidget.NoDockWidgetFeatures)
-        self.dock_sweep.setWidget(self.sweep)
+        self.dock_sweep.setWidget(QWidget())
+        self.dock_sweep.visibilityChanged.connect(self._on_sweep_dock_visibility)
         self.addDockWidget(Qt.RightDockWidgetArea, self.dock_sweep)
 
         # --- Log Panel (bottom) ---
@@ -172,7 +239,31 @@ class MainWindow(QMainWindow):
         self.dock_log.raise_()
 
         # Apply initial adaptive proportions after layout is realized.
-        QTimer.singleShot(0, self._apply_adaptive_dock_sizes)
+        self.dock_resize_timer.start()
+
+    def _on_sweep_dock_visibility(self, visible: bool) -> None:
+        if visible:
+            self._ensure_sweep_panel()
+
+    def _ensure_sweep_panel(self) -> SweepPanel:
+        """Build and wire the Sweep Scan panel on first use."""
+        if self.sweep is not None:
+            return self.sweep
+        sp = self.sweep = SweepPanel()
+        self.dock_sweep.visibilityChanged.disconnect(self._on_sweep_dock_visibility)
+
+        sp.btn_sweep_start.clicked.connect(self._start_sweep)
+        sp.btn_sweep_stop.clicked.connect(self._stop_sweep)
+        sp.chk_sweep_voltage.toggled.connect(sp.update_group_visibility)
+        sp.chk_sweep_pw.toggled.connect(sp.update_group_visibility)
+        sp.chk_sweep_delay.toggled.connect(sp.update_group_visibility)
+        sp.update_group_visibility()
+        sp.btn_sweep_export.clicked.connect(self._export_sweep_csv)
+        sp.btn_sweep_clear.clicked.connect(sp.sweep_results_log.clear)
+        self._apply_sweep_probe_limits()
+
+        self.dock_sweep.setWidget(sp)
+        return sp
 
     def _apply_adaptive_dock_sizes(self) -> None:
         """Resize docks proportionally to current window size."""
@@ -191,7 +282,17 @@ class MainWindow(QMainWindow):
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         super().resizeEvent(event)
-        self._apply_adaptive_dock_sizes()
+        if not self.dock_resize_timer.isActive():
+            self.dock_resize_timer.start()
+
+    def changeEvent(self, event: QEvent) -> None:
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            # No polling while minimized; refresh immediately on restore.
+            was_polling = self.status_poll_timer.isActive()
+            self._update_poll_timers()
+            if self.status_poll_timer.isActive() and not was_polling:
+                self._poll_status()
 
     # ==================================================================
     # Signal/slot wiring
@@ -199,109 +300,71 @@ class MainWindow(QMainWindow):
     def _setup_connections(self) -> None:
         bp = self.basic  # basic panel
         tp = self.terminal  # terminal panel
-        sp = self.sweep  # sweep panel
         lp = self.log_panel
 
         # --- ChipSHOUTER connection ---
         bp.btn_connect.clicked.connect(self._connect_api)
         bp.btn_disconnect.clicked.connect(self._disconnect_api)
-        bp.btn_refresh_ports.clicked.connect(bp.refresh_ports)
+        bp.btn_refresh_ports.clicked.connect(self._refresh_ports)
+        bp.port_box.currentTextChanged.connect(self._update_ui_mutex_state)
+        self.port_scanner.ports_ready.connect(self._on_ports_scanned)
 
         # --- Configuration ---
-        bp.btn_set_voltage.clicked.connect(
-            lambda: self.worker.request_set_voltage.emit(bp.voltage_slider.value())
-        )
-        bp.btn_set_width.clicked.connect(
-            lambda: self.worker.request_set_pulse_width.emit(
-                bp.pulse_width_slider.value()
-            )
-        )
-        bp.btn_set_repeat.clicked.connect(
-            lambda: self.worker.request_set_pulse_repeat.emit(
-                bp.pulse_repeat_slider.value()
-            )
-        )
-        bp.btn_set_deadtime.clicked.connect(
-            lambda: self.worker.request_set_deadtime.emit(bp.deadtime_slider.value())
-        )
+        bp.btn_set_voltage.clicked.connect(self._set_voltage)
+        bp.btn_set_width.clicked.connect(self._set_pulse_width)
+        bp.btn_set_repeat.clicked.connect(self._set_pulse_repeat)
+        bp.btn_set_deadtime.clicked.connect(self._set_deadtime)
         bp.btn_apply_all.clicked.connect(self._apply_all_settings)
-        bp.btn_set_hwtrig_mode.clicked.connect(
-            lambda: self.worker.request_set_hwtrig_mode.emit(
-                bp.hwtrig_mode_box.currentIndex() == 0
-            )
-        )
-        bp.btn_set_hwtrig_term.clicked.connect(
-            lambda: self.worker.request_set_hwtrig_term.emit(
-                bp.hwtrig_term_box.currentIndex() == 0
-            )
-        )
-        bp.btn_reset_device.clicked.connect(self.worker.request_reset.emit)
+        bp.btn_set_hwtrig_mode.clicked.connect(self._set_hwtrig_mode)
+        bp.btn_set_hwtrig_term.clicked.connect(self._set_hwtrig_term)
+        bp.btn_reset_device.clicked.connect(self._reset_device)
 
         # --- Probe tip & PW limits ---
         bp.probe_tip_box.currentTextChanged.connect(self._on_probe_changed)
-        bp.voltage_slider.valueChanged.connect(
-            self._on_voltage_changed_update_pw_limits
-        )
+        bp.voltage_slider.valueChanged.connect(self._schedule_pw_limits)
         self._on_probe_changed()  # apply initial limits
 
         # --- Actions ---
         bp.btn_arm.clicked.connect(self._arm_device)
         bp.btn_disarm.clicked.connect(self._disarm_device)
         bp.btn_pulse.clicked.connect(self._request_pulse)
-        bp.btn_mute.clicked.connect(
-            lambda: self.worker.request_mute.emit(bp.btn_mute.isChecked())
-        )
-        bp.btn_mute.toggled.connect(self._update_mute_button_appearance)
+        bp.btn_mute.clicked.connect(self._toggle_mute)
 
         # --- Serial Terminal ---
         tp.btn_term_connect.clicked.connect(self._connect_terminal)
         tp.btn_term_disconnect.clicked.connect(self._disconnect_terminal)
-        tp.btn_term_refresh.clicked.connect(tp.refresh_ports)
+        tp.btn_term_refresh.clicked.connect(self._refresh_ports)
+        tp.term_port_box.currentTextChanged.connect(self._update_ui_mutex_state)
         tp.btn_send_cmd.clicked.connect(self._send_terminal_command)
         tp.terminal_input.returnPressed.connect(self._send_terminal_command)
         tp.btn_clear_term.clicked.connect(tp.terminal_output.clear)
         tp.btn_send_mode.clicked.connect(self._send_test_mode)
         tp.btn_send_signal.clicked.connect(self._send_test_signal)
         tp.btn_repeat_start.clicked.connect(self._start_repeat_send)
+        tp.repeat_payload_input.textChanged.connect(self._on_repeat_payload_changed)
+        self._on_repeat_payload_changed(tp.repeat_payload_input.text())
         tp.btn_repeat_stop.clicked.connect(self._stop_repeat_send)
         tp.btn_export_terminal_csv.clicked.connect(self._export_terminal_log_csv)
 
-        self.terminal_worker.data_received.connect(
-            self._append_terminal_data, Qt.UniqueConnection
-        )
-        self.terminal_worker.status_signal.connect(
-            self._append_terminal_status, Qt.UniqueConnection
-        )
+        self.terminal_worker.data_available.connect(self._schedule_ui_flush)
+        self.terminal_worker.status_signal.connect(self._append_terminal_status)
 
         # --- Fault log ---
-        lp.btn_read_faults.clicked.connect(
-            lambda: self.worker.request_read_faults_current.emit(True)
-        )
-        lp.btn_read_latched.clicked.connect(
-            self.worker.request_read_faults_latched.emit
-        )
-        lp.btn_clear_faults.clicked.connect(self.worker.request_clear_faults.emit)
+        lp.btn_read_faults.clicked.connect(self._read_faults_current)
+        lp.btn_read_latched.clicked.connect(self._read_faults_latched)
+        lp.btn_clear_faults.clicked.connect(self._clear_faults)
         lp.btn_clear_event_log.clicked.connect(lp.log_view.clear)
 
-        # --- Sweep ---
-        sp.btn_sweep_start.clicked.connect(self._start_sweep)
-        sp.btn_sweep_stop.clicked.connect(self._stop_sweep)
-        sp.chk_sweep_voltage.toggled.connect(sp.update_group_visibility)
-        sp.chk_sweep_pw.toggled.connect(sp.update_group_visibility)
-        sp.chk_sweep_delay.toggled.connect(sp.update_group_visibility)
-        sp.update_group_visibility()
-        sp.btn_sweep_export.clicked.connect(self._export_sweep_csv)
-        sp.btn_sweep_clear.clicked.connect(sp.sweep_results_log.clear)
+        # --- Sweep --- (panel controls are wired in _ensure_sweep_panel)
         self.sweep_worker.progress_signal.connect(self._on_sweep_progress)
-        self.sweep_worker.result_signal.connect(self._on_sweep_result)
+        self.sweep_worker.output_available.connect(self._schedule_ui_flush)
         self.sweep_worker.sweep_finished.connect(self._on_sweep_finished)
-        self.sweep_worker.log_signal.connect(self._on_sweep_log)
 
         # --- Worker -> UI ---
-        self.worker.log_signal.connect(self._append_log)
+        self.worker.logs_available.connect(self._schedule_ui_flush)
         self.worker.status_signal.connect(self._update_status)
         self.worker.reset_detected.connect(self._handle_reset)
-        self.worker.fault_signal.connect(self._append_fault_log)
+        self.worker.fault_signal.connect(self._on_fault_reported)
         self.worker.connection_changed.connect(self._on_api_connection_changed)
         self.worker.armed_changed.connect(self._on_api_armed_changed)
         self.worker.busy_changed.connect(self._on_api_busy_changed)
@@ -310,6 +373,18 @@ class MainWindow(QMainWindow):
     # Button state management
     # ==================================================================
     def _refresh_action_buttons(self) -> None:
+        """Schedule one button update for all state changes in this event-loop pass."""
+        if not self._buttons_refresh_pending:
+            self._buttons_refresh_pending = True
+            QTimer.singleShot(0, self._apply_action_buttons)
+
+    def _apply_action_buttons(self) -> None:
+        self._buttons_refresh_pending = False
+        state = (self.api_connected, self.api_busy, self.api_armed)
+        if state == self._button_state:
+            return
+        self._button_state = state
+
         bp = self.basic
         controls = self.api_connected and not self.api_busy
 
@@ -329,6 +404,21 @@ class MainWindow(QMainWindow):
         bp.btn_reset_device.setEnabled(controls)
         bp.btn_apply_all.setEnabled(controls)
 
+    # ==================================================================
+    # Port discovery
+    # ==================================================================
+    def _refresh_ports(self) -> None:
+        if self.port_scanner.scan():
+            self.basic.btn_refresh_ports.setEnabled(False)
+            self.terminal.btn_term_refresh.setEnabled(False)
+
+    def _on_ports_scanned(self, ports: list[str]) -> None:
+        # One scan serves both combos.
+        self.basic.set_ports(ports)
+        self.terminal.set_ports(ports)
+        self.basic.btn_refresh_ports.setEnabled(True)
+        self.terminal.btn_term_refresh.setEnabled(True)
+
     # ==================================================================
     # API connection (ChipSHOUTER)
     # ==================================================================
@@ -337,14 +427,14 @@ class MainWindow(QMainWindow):
         if self.api_busy:
             self._append_log("Sistema ocupado, espere...")
             return
-        if self.terminal_connected and self.terminal_port == port:
+        if self._port_owner.get(port) == _OWNER_TERMINAL:
             self._append_log(
                 f"Error: Puerto {port} ya está en uso por Serial Terminal. Desconecte primero."
             )
             return
         self.pending_api_action = "connect"
         self.api_operation_timeout.start(API_OPERATION_TIMEOUT_MS)
-        self.worker.request_connect.emit(port)
+        self.worker.request.emit("connect_device", port)
 
     def _disconnect_api(self) -> None:
         if self.api_busy:
@@ -352,46 +442,27 @@ class MainWindow(QMainWindow):
             return
         self.pending_api_action = "disconnect"
         self.api_operation_timeout.start(API_OPERATION_TIMEOUT_MS)
-        self.worker.request_disconnect.emit()
+        self.worker.request.emit("disconnect_device", ())
 
     def _on_api_connection_changed(self, connected: bool, port: str) -> None:
         self.api_connected = connected
-        self.api_port = port if connected else None
-        if connected:
-            self.fault_timer.start(FAULT_POLL_INTERVAL_MS)
-            self.arm_state_timer.start(ARM_STATE_POLL_INTERVAL_MS)
-        else:
-            self.fault_timer.stop()
-            self.arm_state_timer.stop()
+        self._set_port_owner(_OWNER_API, port if connected else None)
+        if not connected:
             self.api_armed = False
-        self._update_ui_mutex_state()
+        self._update_poll_timers()
         self._refresh_action_buttons()
 
     def _on_api_armed_changed(self, armed: bool) -> None:
         self.api_armed = armed
-        bp = self.basic
-        if armed:
-            bp.btn_arm.setStyleSheet(
-                "QPushButton {background-color: #c62828; color: white; font-weight: 900; "
-                "font-size: 14px; border: 3px solid #ffff00;}"
-                "QPushButton:disabled {background-color: #c62828; color: white; font-weight: 900; "
-                "font-size: 14px; border: 3px solid #ffff00;}"
-            )
-            bp.btn_disarm.setStyleSheet(
-                "background-color: #00c853; color: black; font-weight: 900; "
-                "font-size: 14px; border: 2px solid #69f0ae;"
-            )
-        else:
-            bp.btn_arm.setStyleSheet(
-                "QPushButton {background-color: #c62828; color: white; font-weight: 900; "
-                "font-size: 14px; border: 2px solid #ff8a80;}"
-                "QPushButton:disabled {background-color: #c62828; color: white; font-weight: 900; "
-                "font-size: 14px; border: 2px solid #ff8a80;}"
-            )
-            bp.btn_disarm.setStyleSheet(
-                "background-color: #1b5e20; color: white; font-weight: 900; "
-                "font-size: 14px; border: 2px solid #66bb6a;"
-            )
+        self._reset_poll_backoff()
+        if armed != self._armed_style:
+            self._armed_style = armed
+            state = "armed" if armed else "disarmed"
+            for btn in (self.basic.btn_arm, self.basic.btn_disarm):
+                btn.setProperty("state", state)
+                style = btn.style()
+                style.unpolish(btn)
+                style.polish(btn)
         self._refresh_action_buttons()
 
     def _on_api_busy_changed(self, busy: bool) -> None:
@@ -408,62 +479,99 @@ class MainWindow(QMainWindow):
             self.api_busy = False
             self._refresh_action_buttons()
 
+    def _set_port_owner(self, owner: str, port: str | None) -> None:
+        """Record that *owner* now holds *port* (None: it released its port)."""
+        self._port_owner = {p: o for p, o in self._port_owner.items() if o != owner}
+        if port:
+            self._port_owner[port] = owner
+        self._update_ui_mutex_state()
+
     def _update_ui_mutex_state(self) -> None:
         """Update tooltips based on connection states to prevent port conflicts."""
         tp = self.terminal
         bp = self.basic
 
-        if self.api_connected and self.api_port:
-            if tp.term_port_box.currentText() == self.api_port:
-                tp.btn_term_connect.setToolTip(
-                    f"Puerto {self.api_port} en uso por ChipSHOUTER API"
-                )
-            else:
-                tp.btn_term_connect.setToolTip("")
-        else:
-            tp.btn_term_connect.setToolTip("")
-
-        if self.terminal_connected and self.terminal_port:
-            if bp.port_box.currentText() == self.terminal_port:
-                bp.btn_connect.setToolTip(
-                    f"Puerto {self.terminal_port} en uso por Serial Terminal"
-                )
-            else:
-                bp.btn_connect.setToolTip("")
-        else:
-            bp.btn_connect.setToolTip("")
+        port = tp.term_port_box.currentText()
+        tp.btn_term_connect.setToolTip(
+            f"Puerto {port} en uso por {_OWNER_API}"
+            if self._port_owner.get(port) == _OWNER_API
+            else ""
+        )
+        port = bp.port_box.currentText()
+        bp.btn_connect.setToolTip(
+            f"Puerto {port} en uso por {_OWNER_TERMINAL}"
+            if self._port_owner.get(port) == _OWNER_TERMINAL
+            else ""
+        )
 
     # ==================================================================
     # Actions
     # ==================================================================
+    def _set_voltage(self) -> None:
+        self.worker.submit_setting("set_voltage", self.basic.voltage_slider.value())
+
+    def _set_pulse_width(self) -> None:
+        self._flush_pw_limits()
+        self.worker.submit_setting(
+            "set_pulse_width", self.basic.pulse_width_slider.value()
+        )
+
+    def _set_pulse_repeat(self) -> None:
+        self.worker.submit_setting(
+            "set_pulse_repeat", self.basic.pulse_repeat_slider.value()
+        )
+
+    def _set_deadtime(self) -> None:
+        self.worker.submit_setting("set_deadtime", self.basic.deadtime_slider.value())
+
+    def _set_hwtrig_mode(self) -> None:
+        self.worker.submit_setting(
+            "set_hwtrig_mode", self.basic.hwtrig_mode_box.currentIndex() == 0
+        )
+
+    def _set_hwtrig_term(self) -> None:
+        self.worker.submit_setting(
+            "set_hwtrig_term", self.basic.hwtrig_term_box.currentIndex() == 0
+        )
+
+    def _reset_device(self) -> None:
+        self.worker.request.emit("reset_device", ())
+
     def _apply_all_settings(self) -> None:
+        self._flush_pw_limits()
         bp = self.basic
-        self.worker.request_set_voltage.emit(bp.voltage_slider.value())
-        self.worker.request_set_pulse_width.emit(bp.pulse_width_slider.value())
-        self.worker.request_set_pulse_repeat.emit(bp.pulse_repeat_slider.value())
-        self.worker.request_set_deadtime.emit(bp.deadtime_slider.value())
-        self.worker.request_set_hwtrig_mode.emit(bp.hwtrig_mode_box.currentIndex() == 0)
-        self.worker.request_set_hwtrig_term.emit(bp.hwtrig_term_box.currentIndex() == 0)
+        self.worker.submit_setting(
+            "apply_all_settings",
+            {
+                "voltage": bp.voltage_slider.value(),
+                "pulse_width": bp.pulse_width_slider.value(),
+                "pulse_repeat": bp.pulse_repeat_slider.value(),
+                "deadtime": bp.deadtime_slider.value(),
+                "hwtrig_mode": bp.hwtrig_mode_box.currentIndex() == 0,
+                "hwtrig_term": bp.hwtrig_term_box.currentIndex() == 0,
+            }
+        )
 
     def _arm_device(self) -> None:
         if not self.api_connected or self.api_busy:
             return
-        self.worker.request_arm.emit(True)
+        self._reset_poll_backoff()
+        self.worker.request.emit("arm_device", True)
 
     def _disarm_device(self) -> None:
         if not self.api_connected or self.api_busy:
             return
-        self.worker.request_arm.emit(False)
+        self._reset_poll_backoff()
+        self.worker.request.emit("arm_device", False)
 
     def _request_pulse(self) -> None:
         if not self.api_connected or self.api_busy:
             return
-        self.worker.request_fire.emit()
+        self._reset_poll_backoff()
+        self.worker.request.emit("fire_pulse", ())
 
-    @staticmethod
-    def _update_mute_button_appearance(muted: bool) -> None:
-        # Text stays the same regardless of state (as in original)
-        pass
+    def _toggle_mute(self) -> None:
+        self.worker.request.emit("toggle_mute", self.basic.btn_mute.isChecked())
 
     # ==================================================================
     # Serial terminal
@@ -472,13 +580,12 @@ class MainWindow(QMainWindow):
         tp = self.terminal
         port = tp.term_port_box.currentText()
 
-        if self.api_connected and self.api_port == port:
+        if self._port_owner.get(port) == _OWNER_API:
             self._append_terminal_status(
                 f"Error: Puerto {port} ya está en uso por ChipSHOUTER API. Desconecte primero."
             )
             return
 
-        self.serial_timer.stop()
         if self.terminal_worker.is_connected:
             self.terminal_worker.disconnect_serial()
 
@@ -487,17 +594,13 @@ class MainWindow(QMainWindow):
 
         if self.terminal_worker.is_connected:
             self.terminal_connected = True
-            self.terminal_port = port
-            self.serial_timer.start(SERIAL_POLL_INTERVAL_MS)
-            self._update_ui_mutex_state()
+            self._set_port_owner(_OWNER_TERMINAL, port)
 
     def _disconnect_terminal(self) -> None:
-        self.serial_timer.stop()
         self._stop_repeat_send()
         self.terminal_worker.disconnect_serial()
         self.terminal_connected = False
-        self.terminal_port = None
-        self._update_ui_mutex_state()
+        self._set_port_owner(_OWNER_TERMINAL, None)
 
     def _send_terminal_command(self) -> None:
         cmd = self.terminal.terminal_input.text().strip()
@@ -523,7 +626,7 @@ class MainWindow(QMainWindow):
         if not self.terminal_worker.is_connected:
             self._append_terminal_status("Error: Terminal no conectado")
             return
-        payload = tp.repeat_payload_input.text().strip()
+        payload = self._repeat_payload
         if not payload:
             self._append_terminal_status("Error: contenido vacío para envío repetido")
             return
@@ -535,6 +638,10 @@ class MainWindow(QMainWindow):
             f"Repeat TX iniciado: '{payload}' cada {interval} ms"
         )
 
+    def _on_repeat_payload_changed(self, text: str) -> None:
+        # Cached so repeat ticks (down to 10 ms) skip the widget query.
+        self._repeat_payload = text.strip()
+
     def _stop_repeat_send(self) -> None:
         tp = self.terminal
         was_running = self.repeat_send_timer.isActive()
@@ -549,30 +656,48 @@ class MainWindow(QMainWindow):
             self._stop_repeat_send()
             self._append_terminal_status("Repeat TX detenido: terminal desconectado")
             return
-        payload = self.terminal.repeat_payload_input.text().strip()
+        payload = self._repeat_payload
         if not payload:
             self._stop_repeat_send()
             self._append_terminal_status("Repeat TX detenido: contenido vacío")
             return
         self.terminal_worker.send_data(payload)
 
+    def _schedule_ui_flush(self) -> None:
+        if not self.ui_flush_timer.isActive():
+            self.ui_flush_timer.start()
+
+    def _flush_ui_queues(self) -> None:
+        self._drain_terminal_data()
+        self._drain_worker_logs()
+        self._drain_sweep_output()
+
+    def _drain_terminal_data(self) -> None:
+        data = self.terminal_worker.take_received()
+        if data:
+            self._append_terminal_data(data)
+
     def _append_terminal_data(self, data: str) -> None:
-        now = time.time()
-        if data == self.last_terminal_data and (now - self.last_terminal_time) < 0.5:
+        h = hash(data)
+        now = time.monotonic()
+        if h == self._last_rx_hash and now - self._last_rx_time < 0.5:
             return
-        self.last_terminal_data = data
-        self.last_terminal_time = now
-
-        out = self.terminal.terminal_output
-        out.moveCursor(QTextCursor.End)
-        out.insertPlainText(data)
-        if not data.endswith("\n"):
-            out.insertPlainText("\n")
-        out.moveCursor(QTextCursor.End)
+        self._last_rx_hash = h
+        self._last_rx_time = now
+
+        # Follow new output only if the view was already at the bottom, so
+        # a user scrolled up to inspect earlier lines is not yanked down.
+        sb = self.terminal.terminal_output.verticalScrollBar()
+        at_bottom = sb.value() >= sb.maximum() - 4
+        cursor = self.terminal.output_cursor
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(data if data.endswith("\n") else data + "\n")
+        if at_bottom:
+            sb.setValue(sb.maximum())
 
     def _append_terminal_status(self, status: str) -> None:
-        self.terminal.terminal_output.append(
-            f"[{time.strftime('%H:%M:%S')}] {status}\n"
+        self.terminal.terminal_output.appendPlainText(
+            f"[{_hhmmss()}] {status}\n"
         )
         self._append_log(status)
 
@@ -583,32 +708,64 @@ class MainWindow(QMainWindow):
         self.setWindowTitle(f"{APP_TITLE} - {status}")
 
     def _append_log(self, text: str) -> None:
-        timestamp = f"[{time.strftime('%H:%M:%S')}] {text}"
-        self.log_panel.log_view.append(timestamp)
-        if text.startswith("RX:"):
-            self.terminal.terminal_output.append(text)
-
-    def _poll_faults(self) -> None:
-        if self.api_connected:
-            self.worker.request_read_faults_current.emit(False)
-
-    def _poll_arm_state(self) -> None:
-        if self.api_connected:
-            self.worker.request_read_arm_state.emit()
+        self._append_log_lines([text])
+
+    def _append_log_lines(self, lines: list[str]) -> None:
+        ts = _hhmmss()
+        self.log_panel.append_lines("\n".join(f"[{ts}] {t}" for t in lines))
+        rx = [t for t in lines if t.startswith("RX:")]
+        if rx:
+            self.terminal.terminal_output.appendPlainText("\n".join(rx))
+
+    def _drain_worker_logs(self) -> None:
+        lines = self.worker.take_logs()
+        if lines:
+            self._append_log_lines(lines)
+
+    def _update_poll_timers(self) -> None:
+        """Run the status poll only while connected, idle and visible."""
+        if self.api_connected and not self.sweep_running and not self.isMinimized():
+            if not self.status_poll_timer.isActive():
+                self._reset_poll_backoff()
+                self.status_poll_timer.start()
+        else:
+            self.status_poll_timer.stop()
+
+    def _poll_status(self) -> None:
+        if self.api_connected and not self.api_busy:
+            self.worker.request.emit("poll_status", ())
+            # Back off while the state is steady; arm / fault changes reset it.
+            self._status_idle_polls += 1
+            if self._status_idle_polls > STATUS_POLL_IDLE_POLLS:
+                interval = self.status_poll_timer.interval()
+                if interval < STATUS_POLL_MAX_INTERVAL_MS:
+                    self.status_poll_timer.setInterval(
+                        min(interval * 2, STATUS_POLL_MAX_INTERVAL_MS)
+                    )
+
+    def _reset_poll_backoff(self) -> None:
+        self._status_idle_polls = 0
+        if self.status_poll_timer.interval() != STATUS_POLL_INTERVAL_MS:
+            self.status_poll_timer.setInterval(STATUS_POLL_INTERVAL_MS)
+
+    def _read_faults_current(self) -> None:
+        self.worker.request.emit("read_faults_current", True)
+
+    def _read_faults_latched(self) -> None:
+        self.worker.request.emit("read_faults_latched", ())
+
+    def _clear_faults(self) -> None:
+        self.worker.request.emit("clear_faults", ())
+
+    def _on_fault_reported(self, text: str) -> None:
+        self._reset_poll_backoff()
+        self._append_fault_log(text)
 
     def _append_fault_log(self, text: str) -> None:
-        ts = time.strftime("%H:%M:%S")
-        if "[CURRENT]" in text and "No faults" not in text and "Error" not in text:
-            color = "red"
-        elif "[LATCHED]" in text and "No latched" not in text and "Error" not in text:
-            color = "#cc6600"
-        elif "Error" in text:
-            color = "darkred"
-        else:
-            color = "green"
-        view = self.log_panel.log_view
-        view.append(f"<span style='color:{color};'>[{ts}] {text}</span>")
-        view.moveCursor(QTextCursor.End)
+        ts = _hhmmss()
+        m = _FAULT_CLASS_RE.match(text)
+        color = _FAULT_COLORS[m.lastgroup] if m else "green"
+        self.log_panel.append_lines(f"[{ts}] {text}", color)
 
     def _handle_reset(self) -> None:
         self.api_armed = False
@@ -622,24 +779,10 @@ class MainWindow(QMainWindow):
     def _get_pw_limits_for_voltage(self, voltage: int, probe: str | None = None):
         if probe is None:
             probe = self.basic.probe_tip_box.currentText()
-        info = PROBE_LIMITS.get(probe, PROBE_LIMITS["4mm"])
-        table = info["table"]
-        v = max(table[0][0], min(table[-1][0], voltage))
-        for i in range(len(table) - 1):
-            v0, pw_min0, pw_max0 = table[i]
-            v1, pw_min1, pw_max1 = table[i + 1]
-            if v0 <= v <= v1:
-                if v1 == v0:
-                    return pw_min0, pw_max0
-                t = (v - v0) / (v1 - v0)
-                pw_min = int(round(pw_min0 + t * (pw_min1 - pw_min0)))
-                pw_max = int(round(pw_max0 + t * (pw_max1 - pw_max0)))
-                return pw_min, pw_max
-        return table[-1][1], table[-1][2]
+        return pw_limits_for_voltage(voltage, probe)
 
     def _on_probe_changed(self) -> None:
         bp = self.basic
-        sp = self.sweep
         probe = bp.probe_tip_box.currentText()
         info = PROBE_LIMITS.get(probe, PROBE_LIMITS["4mm"])
         v_min, v_max = info["v_min"], info["v_max"]
@@ -651,6 +794,18 @@ class MainWindow(QMainWindow):
         elif cur_v > v_max:
             bp.voltage_slider.setValue(v_max)
 
+        self._apply_sweep_probe_limits()
+        self.pw_limits_timer.stop()
+        self._on_voltage_changed_update_pw_limits(bp.voltage_slider.value())
+
+    def _apply_sweep_probe_limits(self) -> None:
+        """Bound the sweep V/PW sliders by the probe's voltage range and PW envelope."""
+        sp = self.sweep
+        if sp is None:
+            return  # applied when the panel is built
+        probe = self.basic.probe_tip_box.currentText()
+        info = PROBE_LIMITS.get(probe, PROBE_LIMITS["4mm"])
+        v_min, v_max = info["v_min"], info["v_max"]
         sp.sweep_v_start_slider.setRange(v_min, v_max)
         sp.sweep_v_end_slider.setRange(v_min, v_max)
         if sp.sweep_v_start_slider.value() < v_min:
@@ -658,11 +813,27 @@ class MainWindow(QMainWindow):
         if sp.sweep_v_end_slider.value() > v_max:
             sp.sweep_v_end_slider.setValue(v_max)
 
-        self._on_voltage_changed_update_pw_limits(bp.voltage_slider.value())
+        global_pw_min, global_pw_max = pw_envelope(probe)
+        sp.sweep_pw_start_slider.setRange(global_pw_min, global_pw_max)
+        sp.sweep_pw_end_slider.setRange(global_pw_min, global_pw_max)
+        if sp.sweep_pw_start_slider.value() < global_pw_min:
+            sp.sweep_pw_start_slider.setValue(global_pw_min)
+        if sp.sweep_pw_end_slider.value() > global_pw_max:
+            sp.sweep_pw_end_slider.setValue(global_pw_max)
+
+    def _schedule_pw_limits(self, _value: int) -> None:
+        # No-argument start(): valueChanged(int) bound to start(int msec)
+        # would replace SLIDER_DEBOUNCE_MS with the slider value.
+        self.pw_limits_timer.start()
+
+    def _flush_pw_limits(self) -> None:
+        """Apply a debounced PW-limit update now (before reading PW values)."""
+        if self.pw_limits_timer.isActive():
+            self.pw_limits_timer.stop()
+            self._on_voltage_changed_update_pw_limits()
 
     def _on_voltage_changed_update_pw_limits(self, voltage: int | None = None) -> None:
         bp = self.basic
-        sp = self.sweep
         if voltage is None:
             voltage = bp.voltage_slider.value()
 
@@ -676,25 +847,14 @@ class MainWindow(QMainWindow):
             bp.pulse_width_slider.setValue(pw_max)
         bp.pulse_width_edit.setText(str(bp.pulse_width_slider.value()))
 
-        probe = bp.probe_tip_box.currentText()
-        info = PROBE_LIMITS.get(probe, PROBE_LIMITS["4mm"])
-        global_pw_min = min(row[1] for row in info["table"])
-        global_pw_max = max(row[2] for row in info["table"])
-        sp.sweep_pw_start_slider.setRange(global_pw_min, global_pw_max)
-        sp.sweep_pw_end_slider.setRange(global_pw_min, global_pw_max)
-        if sp.sweep_pw_start_slider.value() < global_pw_min:
-            sp.sweep_pw_start_slider.setValue(global_pw_min)
-        if sp.sweep_pw_end_slider.value() > global_pw_max:
-            sp.sweep_pw_end_slider.setValue(global_pw_max)
-
         bp.pw_limits_label.setText(f"PW: {pw_min}\u2013{pw_max} ns @ {voltage}V")
 
     # ==================================================================
     # CSV export
     # ==================================================================
     def _export_terminal_log_csv(self) -> None:
-        log_text = self.terminal.terminal_output.toPlainText().strip()
-        if not log_text:
+        doc = self.terminal.terminal_output.document()
+        if doc.isEmpty():
             self._append_log("No hay datos para exportar (terminal_log)")
             return
         file_path, _ = QFileDialog.getSaveFileName(
@@ -706,7 +866,7 @@ class MainWindow(QMainWindow):
         if not file_path:
             return
         try:
-            export_raw_lines_to_csv(log_text, file_path)
+            export_raw_lines_to_csv(_document_lines(doc), file_path)
             self._append_log(f"Terminal log exportado a CSV: {file_path}")
         except Exception as e:
             self._append_log(f"Error exportando terminal CSV: {e}")
@@ -725,7 +885,8 @@ class MainWindow(QMainWindow):
         if not file_path:
             return
         try:
-            export_sweep_results_to_csv(results, file_path)
+            note = self.sweep_worker.coverage_note
+            export_sweep_results_to_csv(results, file_path, (note,) if note else ())
             self._append_log(f"Sweep CSV exported: {file_path}")
         except Exception as e:
             self._append_log(f"Error exporting sweep CSV: {e}")
@@ -748,11 +909,11 @@ class MainWindow(QMainWindow):
             self._append_log("Error: No ChipSHOUTER device available.")
             return
 
-        self.fault_timer.stop()
-        self.arm_state_timer.stop()
-        self.serial_timer.stop()
+        self.status_poll_timer.stop()
+        self.terminal_worker.pause_reading()
         self._stop_repeat_send()
 
+        self._flush_pw_limits()
         self.sweep_running = True
         sp = self.sweep
         sp.btn_sweep_start.setEnabled(False)
@@ -761,32 +922,11 @@ class MainWindow(QMainWindow):
         sp.sweep_progress.setValue(0)
 
         config = sp.get_config()
-
-        # Calculate total points for progress bar
-        axes = config["sweep_axes"]
-        v_count = (
-            len(range(config["v_start"], config["v_end"] + 1, max(1, config["v_step"])))
-            if "voltage" in axes
-            else 1
-        )
-        pw_count = (
-            len(
-                range(
-                    config["pw_start"], config["pw_end"] + 1, max(1, config["pw_step"])
-                )
-            )
-            if "pulse_width" in axes
-            else 1
-        )
-        delays = list(
-            range(
-                config["delay_start"],
-                config["delay_end"] + 1,
-                max(1, config["delay_step"]),
+        config["probe"] = self.basic.probe_tip_box.currentText()
+        if sp.chk_sweep_autosave.isChecked():
+            config["autosave_path"] = os.path.join(
+                SWEEP_AUTOSAVE_DIR, default_filename("sweep_results")
             )
-        )
-        d_count = max(1, len(delays)) if "delay" in axes else 1
-        sp.sweep_progress.setMaximum(v_count * pw_count * d_count)
 
         self._append_log(
             f"Sweep started: V[{config['v_start']}-{config['v_end']}] "
@@ -803,9 +943,22 @@ class MainWindow(QMainWindow):
         self.sweep.sweep_status_label.setText("Stopping...")
 
     def _on_sweep_progress(self, current: int, total: int, info: str) -> None:
+        self.sweep.sweep_progress.setMaximum(max(1, total))
         self.sweep.sweep_progress.setValue(current)
         self.sweep.sweep_status_label.setText(info)
 
+    def _drain_sweep_output(self) -> None:
+        """Show queued sweep log lines and results in order; one main-log append."""
+        logs: list[str] = []
+        for item in self.sweep_worker.take_output():
+            if isinstance(item, dict):
+                self._on_sweep_result(item)
+            else:
+                self._on_sweep_log(item)
+                logs.append(f"[Sweep] {item}")
+        if logs:
+            self._append_log_lines(logs)
+
     def _on_sweep_result(self, result: dict) -> None:
         v = result["voltage"]
         pw = result["pulse_width"]
@@ -823,12 +976,14 @@ class MainWindow(QMainWindow):
             color, marker = "#ffab40", "ERROR"
         else:
             color, marker = "#69f0ae", "OK"
-        self.sweep.sweep_results_log.append(
-            f"<span style='color:{color};'>V={v:>3}V  PW={pw:>3}ns  D={d:>3}\u00b5s  "
-            f"G:{g} R:{r} E:{e} N:{n}  Rate:{rate}  [{marker}]</span>"
+        self.sweep.append_lines(
+            f"V={v:>3}V  PW={pw:>3}ns  D={d:>3}\u00b5s  "
+            f"G:{g} R:{r} E:{e} N:{n}  Rate:{rate}  [{marker}]",
+            color,
         )
 
     def _on_sweep_finished(self, summary: str) -> None:
+        self._drain_sweep_output()  # show the last points before the summary
         self.sweep_running = False
         sp = self.sweep
         sp.btn_sweep_start.setEnabled(True)
@@ -836,17 +991,12 @@ class MainWindow(QMainWindow):
         sp.sweep_status_label.setText(summary)
         self._append_log(f"Sweep: {summary}")
 
-        if self.api_connected:
-            self.fault_timer.start(FAULT_POLL_INTERVAL_MS)
-            self.arm_state_timer.start(ARM_STATE_POLL_INTERVAL_MS)
+        self._update_poll_timers()
         if self.terminal_connected and self.terminal_worker.is_connected:
-            self.serial_timer.start(SERIAL_POLL_INTERVAL_MS)
+            self.terminal_worker.resume_reading()
 
     def _on_sweep_log(self, text: str) -> None:
-        self.sweep.sweep_results_log.append(
-            f"<span style='color:#888;'>[LOG] {text}</span>"
-        )
-        self._append_log(f"[Sweep] {text}")
+        self.sweep.append_lines(f"[LOG] {text}", "#888")
 
     # ==================================================================
     # Cleanup
@@ -857,10 +1007,8 @@ class MainWindow(QMainWindow):
         self.sweep_thread.quit()
         self.sweep_thread.wait()
 
-        self.serial_timer.stop()
         self.repeat_send_timer.stop()
-        self.fault_timer.stop()
-        self.arm_state_timer.stop()
+        self.status_poll_timer.stop()
 
         self.terminal_worker.disconnect_serial()
         self.terminal_thread.quit()
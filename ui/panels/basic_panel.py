@@ -18,7 +18,8 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QLocale, QObject, QSignalBlocker, Qt
+from PySide6.QtGui import QIntValidator
 
 from config import (
     DEFAULT_DEADTIME,
@@ -30,7 +31,35 @@ from config import (
     PULSE_WIDTH_RANGE,
     VOLTAGE_RANGE,
 )
-from utils.serial_utils import refresh_port_combobox
+from utils.serial_utils import populate_port_combobox
+
+# Device-configuration slider rows, top to bottom:
+# (attribute prefix for <prefix>_slider / <prefix>_edit, Set-button
+#  attribute, label, slider range, default value)
+_SLIDER_ROWS = (
+    ("voltage", "btn_set_voltage", "Voltage (V):", VOLTAGE_RANGE, DEFAULT_VOLTAGE),
+    (
+        "pulse_width",
+        "btn_set_width",
+        "Pulse Width (ns):",
+        PULSE_WIDTH_RANGE,
+        DEFAULT_PULSE_WIDTH,
+    ),
+    (
+        "pulse_repeat",
+        "btn_set_repeat",
+        "Pulse Repeat:",
+        PULSE_REPEAT_RANGE,
+        DEFAULT_PULSE_REPEAT,
+    ),
+    (
+        "deadtime",
+        "btn_set_deadtime",
+        "Deadtime (ms):",
+        DEADTIME_RANGE,
+        DEFAULT_DEADTIME,
+    ),
+)
 
 
 class BasicPanel(QWidget):
@@ -52,16 +81,15 @@ class BasicPanel(QWidget):
         h = QHBoxLayout(group)
 
         self.port_box = QComboBox()
-        refresh_port_combobox(self.port_box)
 
         self.btn_refresh_ports = QPushButton("\u27f3")  # ⟳
         self.btn_refresh_ports.setFixedWidth(30)
 
         self.btn_connect = QPushButton("Connect")
-        self.btn_connect.setStyleSheet("background-color: #1b5e20; color: white;")
+        self.btn_connect.setObjectName("btn_connect")
 
         self.btn_disconnect = QPushButton("Disconnect")
-        self.btn_disconnect.setStyleSheet("background-color: #bf360c; color: white;")
+        self.btn_disconnect.setObjectName("btn_disconnect")
 
         h.addWidget(QLabel("Port:"))
         h.addWidget(self.btn_refresh_ports)
@@ -83,39 +111,20 @@ class BasicPanel(QWidget):
         self.probe_tip_box = QComboBox()
         self.probe_tip_box.addItems(["4mm", "1mm"])
         self.probe_tip_box.setCurrentText("4mm")
-        self.probe_tip_box.setStyleSheet("font-weight: bold;")
+        self.probe_tip_box.setObjectName("probe_tip_box")
         grid.addWidget(self.probe_tip_box, 0, 1)
         self.pw_limits_label = QLabel("")
-        self.pw_limits_label.setStyleSheet("color: #ffab40; font-size: 11px;")
+        self.pw_limits_label.setObjectName("pw_limits_label")
         grid.addWidget(self.pw_limits_label, 0, 2, 1, 2)
 
-        # Row 1 – Voltage
-        self.voltage_slider, self.voltage_edit, self.btn_set_voltage = (
-            self._add_slider_row(
-                grid, 1, "Voltage (V):", VOLTAGE_RANGE, DEFAULT_VOLTAGE
-            )
-        )
-
-        # Row 2 – Pulse Width
-        self.pulse_width_slider, self.pulse_width_edit, self.btn_set_width = (
-            self._add_slider_row(
-                grid, 2, "Pulse Width (ns):", PULSE_WIDTH_RANGE, DEFAULT_PULSE_WIDTH
-            )
-        )
-
-        # Row 3 – Pulse Repeat
-        self.pulse_repeat_slider, self.pulse_repeat_edit, self.btn_set_repeat = (
-            self._add_slider_row(
-                grid, 3, "Pulse Repeat:", PULSE_REPEAT_RANGE, DEFAULT_PULSE_REPEAT
-            )
-        )
-
-        # Row 4 – Deadtime
-        self.deadtime_slider, self.deadtime_edit, self.btn_set_deadtime = (
-            self._add_slider_row(
-                grid, 4, "Deadtime (ms):", DEADTIME_RANGE, DEFAULT_DEADTIME
-            )
-        )
+        # Rows 1-4 – slider / edit / Set rows
+        for row, (name, btn_name, label, range_, default) in enumerate(
+            _SLIDER_ROWS, start=1
+        ):
+            slider, edit, btn = self._add_slider_row(grid, row, label, range_, default)
+            setattr(self, f"{name}_slider", slider)
+            setattr(self, f"{name}_edit", edit)
+            setattr(self, btn_name, btn)
 
         # Row 5 – HW Trigger Mode
         grid.addWidget(QLabel("HW Trigger Mode:"), 5, 0)
@@ -135,12 +144,12 @@ class BasicPanel(QWidget):
 
         # Row 7 – Reset
         self.btn_reset_device = QPushButton("Reset Device")
-        self.btn_reset_device.setStyleSheet("background-color: #b71c1c; color: white;")
+        self.btn_reset_device.setObjectName("btn_reset_device")
         grid.addWidget(self.btn_reset_device, 7, 0, 1, 3)
 
         # Row 8 – Apply All
         self.btn_apply_all = QPushButton("Apply All Settings")
-        self.btn_apply_all.setStyleSheet("background-color: #01579b; color: white;")
+        self.btn_apply_all.setObjectName("btn_apply_all")
         grid.addWidget(self.btn_apply_all, 8, 0, 1, 3)
 
         parent_layout.addWidget(group)
@@ -152,37 +161,25 @@ class BasicPanel(QWidget):
         group = QGroupBox("Actions")
         h = QHBoxLayout(group)
 
+        # Styled by the theme QSS (#btn_arm / #btn_disarm + "state" property)
         self.btn_arm = QPushButton("ARM")
-        self.btn_arm.setStyleSheet(
-            "QPushButton {background-color: #c62828; color: white; font-weight: 900; "
-            "font-size: 14px; border: 2px solid #ff8a80;}"
-            "QPushButton:disabled {background-color: #c62828; color: white; font-weight: 900; "
-            "font-size: 14px; border: 2px solid #ff8a80;}"
-        )
+        self.btn_arm.setObjectName("btn_arm")
         self.btn_arm.setFixedHeight(50)
 
         self.btn_disarm = QPushButton("DISARM")
-        self.btn_disarm.setStyleSheet(
-            "background-color: #1b5e20; font-weight: 900; color: white; "
-            "border: 1px solid #66bb6a;"
-        )
+        self.btn_disarm.setObjectName("btn_disarm")
         self.btn_disarm.setFixedHeight(50)
         self.btn_disarm.setEnabled(False)
 
         self.btn_pulse = QPushButton("PULSE")
-        self.btn_pulse.setStyleSheet(
-            "background-color: #e64a19; font-weight: bold; color: white;"
-        )
+        self.btn_pulse.setObjectName("btn_pulse")
         self.btn_pulse.setFixedHeight(50)
         self.btn_pulse.setEnabled(False)
 
         self.btn_mute = QPushButton("MUTE SOUND")
         self.btn_mute.setCheckable(True)
         self.btn_mute.setFixedHeight(50)
-        self.btn_mute.setStyleSheet(
-            "QPushButton {background-color: #37474f; color: white;}"
-            "QPushButton:checked {background-color: #ffb300; color: black; font-weight: bold;}"
-        )
+        self.btn_mute.setObjectName("btn_mute")
 
         h.addWidget(self.btn_arm)
         h.addWidget(self.btn_disarm)
@@ -212,26 +209,69 @@ class BasicPanel(QWidget):
         grid.addWidget(edit, row, 2)
 
         # Keep slider <-> edit in sync
-        slider.valueChanged.connect(lambda v, e=edit: e.setText(str(v)))
-        edit.editingFinished.connect(
-            lambda s=slider, e=edit: _sync_edit_to_slider(e, s)
-        )
+        _SliderEditSync(slider, edit)
 
         btn = QPushButton("Set")
         grid.addWidget(btn, row, 3)
 
         return slider, edit, btn
 
-    def refresh_ports(self) -> None:
-        """Refresh the ChipSHOUTER port combo box."""
-        refresh_port_combobox(self.port_box)
-
-
-def _sync_edit_to_slider(edit: QLineEdit, slider: QSlider) -> None:
-    """Sync a QLineEdit value back to its paired QSlider, clamping to range."""
-    try:
-        val = int(edit.text())
-        val = max(slider.minimum(), min(slider.maximum(), val))
-        slider.setValue(val)
-    except ValueError:
-        edit.setText(str(slider.value()))
+    def set_ports(self, ports: list[str]) -> None:
+        """Show *ports* in the ChipSHOUTER port combo box."""
+        populate_port_combobox(self.port_box, ports)
+
+
+class _SliderEditSync(QObject):
+    """
+    Keep a QSlider and its paired QLineEdit in sync.
+
+    Owned by the slider, so it lives exactly as long as the row; bound
+    methods instead of lambdas keep the widgets out of closure cycles.
+    """
+
+    def __init__(self, slider: QSlider, edit: QLineEdit) -> None:
+        super().__init__(slider)
+        self._slider = slider
+        self._edit = edit
+        edit.setValidator(_SliderValidator(slider))
+        slider.valueChanged.connect(self._on_slider_changed)
+        edit.editingFinished.connect(self._on_edit_finished)
+
+    def _on_slider_changed(self, value: int) -> None:
+        # Nothing listens to the edit's text signals; an unchanged text
+        # (e.g. the slider echoing a value just typed) is not rewritten.
+        text = str(value)
+        edit = self._edit
+        if edit.text() != text:
+            with QSignalBlocker(edit):
+                edit.setText(text)
+
+    def _on_edit_finished(self) -> None:
+        edit = self._edit
+        if not edit.hasAcceptableInput():  # e.g. text set programmatically
+            edit.setText(edit.validator().fixup(edit.text()))
+        self._slider.setValue(int(edit.text()))
+
+
+class _SliderValidator(QIntValidator):
+    """
+    Integer validator bounded by a slider's current range.
+
+    Keystrokes are checked in Qt; on Enter or focus-out, ``fixup`` clamps
+    an out-of-range number (or restores the slider value for anything
+    else) so ``editingFinished`` still fires.
+    """
+
+    def __init__(self, slider: QSlider) -> None:
+        super().__init__(slider.minimum(), slider.maximum(), slider)
+        locale = QLocale.c()
+        locale.setNumberOptions(QLocale.RejectGroupSeparator)
+        self.setLocale(locale)  # plain digits only, so int() always parses
+        self._slider = slider
+        slider.rangeChanged.connect(self.setRange)
+
+    def fixup(self, text: str) -> str:
+        try:
+            return str(max(self.bottom(), min(self.top(), int(text))))
+        except ValueError:
+            return str(self._slider.value())
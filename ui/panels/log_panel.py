@@ -6,11 +6,14 @@ from PySide6.QtWidgets import (
     QGroupBox,
     QHBoxLayout,
     QLabel,
+    QPlainTextEdit,
     QPushButton,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
+from PySide6.QtGui import QColor, QTextCharFormat, QTextCursor
+
+from config import LOG_MAX_BLOCKS
 
 
 class LogPanel(QWidget):
@@ -31,7 +34,7 @@ class LogPanel(QWidget):
         self.btn_read_latched.setFixedHeight(24)
         self.btn_clear_faults = QPushButton("Clear Faults")
         self.btn_clear_faults.setFixedHeight(24)
-        self.btn_clear_faults.setStyleSheet("background-color: #bf360c; color: white;")
+        self.btn_clear_faults.setObjectName("btn_clear_faults")
         self.btn_clear_event_log = QPushButton("Clear")
         self.btn_clear_event_log.setFixedHeight(24)
 
@@ -42,8 +45,58 @@ class LogPanel(QWidget):
         header.addStretch()
         layout.addLayout(header)
 
-        # Log text area
-        self.log_view = QTextEdit()
+        # Log text area; lines are inserted through append_lines()
+        self.log_view = QPlainTextEdit()
         self.log_view.setReadOnly(True)
-        self.log_view.setStyleSheet("background-color: #252526; color: #eee;")
+        self.log_view.setUndoRedoEnabled(False)
+        self.log_view.setMaximumBlockCount(LOG_MAX_BLOCKS)
+        self.log_view.setObjectName("log_view")
         layout.addWidget(self.log_view)
+
+        self._appender = _LineAppender(self.log_view)
+
+    # ------------------------------------------------------------------
+    # Public helpers
+    # ------------------------------------------------------------------
+    def append_lines(self, text: str, color: str | None = None) -> None:
+        """Append *text* (one or more lines) to the log; see ``_LineAppender``."""
+        self._appender.append(text, color)
+
+
+class _LineAppender:
+    """
+    Append colored lines to a read-only ``QPlainTextEdit``.
+
+    One cursor and one char format per color are reused for every insert.
+    """
+
+    def __init__(self, view: QPlainTextEdit) -> None:
+        self._view = view
+        self._cursor = QTextCursor(view.document())
+        self._formats: dict[str | None, QTextCharFormat] = {None: QTextCharFormat()}
+
+    def append(self, text: str, color: str | None = None) -> None:
+        """
+        Append *text* (one or more lines) at the end of the view.
+
+        *color* is a Qt color name for the text; None uses the view's
+        default color.  Every line gets an explicit format, so a colored
+        line does not leak its color into the next one.  The view only
+        follows new lines if it was already scrolled to the bottom.
+        """
+        fmt = self._formats.get(color)
+        if fmt is None:
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self._formats[color] = fmt
+
+        view = self._view
+        sb = view.verticalScrollBar()
+        at_bottom = sb.value() >= sb.maximum() - 4
+        cursor = self._cursor
+        cursor.movePosition(QTextCursor.End)
+        if not view.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(text, fmt)
+        if at_bottom:
+            sb.setValue(sb.maximum())
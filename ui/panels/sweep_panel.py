@@ -12,17 +12,16 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QPlainTextEdit,
     QProgressBar,
     QPushButton,
     QScrollArea,
     QSlider,
     QSpinBox,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
 
 from config import (
     SWEEP_DELAY_END,
@@ -39,12 +38,15 @@ from config import (
     SWEEP_PULSE_REPEAT,
     SWEEP_PULSES_PER_POINT,
     SWEEP_EXPECTED_CT,
+    SWEEP_LOG_MAX_BLOCKS,
     SWEEP_V_END,
     SWEEP_V_START,
     SWEEP_V_STEP,
     VOLTAGE_RANGE,
 )
-from ui.panels.basic_panel import _sync_edit_to_slider
+from ui.panels.basic_panel import _SliderEditSync
+from ui.panels.log_panel import _LineAppender
+from ui.theme import monospace_font
 
 
 class SweepPanel(QWidget):
@@ -81,7 +83,7 @@ class SweepPanel(QWidget):
         lbl = QLabel(
             "\u26a1 Uses Serial Terminal connection to target board (ext HW trigger)"
         )
-        lbl.setStyleSheet("color: #ffab40; font-weight: bold; padding: 4px;")
+        lbl.setObjectName("sweep_info_label")
         parent.addWidget(lbl)
 
     def _build_axis_checkboxes(self, parent: QVBoxLayout) -> None:
@@ -90,15 +92,15 @@ class SweepPanel(QWidget):
 
         self.chk_sweep_voltage = QCheckBox("Voltage")
         self.chk_sweep_voltage.setChecked(True)
-        self.chk_sweep_voltage.setStyleSheet("font-weight: bold; color: #4fc3f7;")
+        self.chk_sweep_voltage.setObjectName("chk_sweep_voltage")
 
         self.chk_sweep_pw = QCheckBox("Pulse Width")
         self.chk_sweep_pw.setChecked(True)
-        self.chk_sweep_pw.setStyleSheet("font-weight: bold; color: #81c784;")
+        self.chk_sweep_pw.setObjectName("chk_sweep_pw")
 
         self.chk_sweep_delay = QCheckBox("Delay")
         self.chk_sweep_delay.setChecked(False)
-        self.chk_sweep_delay.setStyleSheet("font-weight: bold; color: #ffb74d;")
+        self.chk_sweep_delay.setObjectName("chk_sweep_delay")
 
         h.addWidget(self.chk_sweep_voltage)
         h.addWidget(self.chk_sweep_pw)
@@ -232,15 +234,11 @@ class SweepPanel(QWidget):
         h = QHBoxLayout()
 
         self.btn_sweep_start = QPushButton("\u25b6 Start Sweep")
-        self.btn_sweep_start.setStyleSheet(
-            "background-color: #00695c; color: white; font-weight: bold; font-size: 14px;"
-        )
+        self.btn_sweep_start.setObjectName("btn_sweep_start")
         self.btn_sweep_start.setFixedHeight(40)
 
         self.btn_sweep_stop = QPushButton("\u25a0 Stop")
-        self.btn_sweep_stop.setStyleSheet(
-            "background-color: #b71c1c; color: white; font-weight: bold; font-size: 14px;"
-        )
+        self.btn_sweep_stop.setObjectName("btn_sweep_stop")
         self.btn_sweep_stop.setFixedHeight(40)
         self.btn_sweep_stop.setEnabled(False)
 
@@ -254,24 +252,31 @@ class SweepPanel(QWidget):
         parent.addWidget(self.sweep_progress)
 
         self.sweep_status_label = QLabel("Ready")
-        self.sweep_status_label.setStyleSheet("color: #aaa;")
+        self.sweep_status_label.setObjectName("sweep_status_label")
         parent.addWidget(self.sweep_status_label)
 
     def _build_results(self, parent: QVBoxLayout) -> None:
-        self.sweep_results_log = QTextEdit()
+        # Lines are inserted through append_lines()
+        self.sweep_results_log = QPlainTextEdit()
         self.sweep_results_log.setReadOnly(True)
-        self.sweep_results_log.setFont(QFont("Consolas", 9))
-        self.sweep_results_log.setStyleSheet(
-            "background-color: #1e1e1e; color: #00ff00;"
-        )
+        self.sweep_results_log.setUndoRedoEnabled(False)
+        self.sweep_results_log.setMaximumBlockCount(SWEEP_LOG_MAX_BLOCKS)
+        self.sweep_results_log.setFont(monospace_font(9))
+        self.sweep_results_log.setObjectName("sweep_results_log")
         parent.addWidget(self.sweep_results_log)
+        self._results_appender = _LineAppender(self.sweep_results_log)
 
         h = QHBoxLayout()
         self.btn_sweep_export = QPushButton("Export Sweep CSV")
-        self.btn_sweep_export.setStyleSheet("background-color: #1565c0; color: white;")
+        self.btn_sweep_export.setObjectName("btn_sweep_export")
         self.btn_sweep_clear = QPushButton("Clear")
+        self.chk_sweep_autosave = QCheckBox("Auto-save CSV")
+        self.chk_sweep_autosave.setToolTip(
+            "Write each point to a CSV in the sweep_results folder as the sweep runs"
+        )
         h.addWidget(self.btn_sweep_export)
         h.addWidget(self.btn_sweep_clear)
+        h.addWidget(self.chk_sweep_autosave)
         h.addStretch()
         parent.addLayout(h)
 
@@ -294,13 +299,14 @@ class SweepPanel(QWidget):
         edit.setAlignment(Qt.AlignCenter)
         grid.addWidget(edit, row, 2)
 
-        slider.valueChanged.connect(lambda v, e=edit: e.setText(str(v)))
-        edit.editingFinished.connect(
-            lambda s=slider, e=edit: _sync_edit_to_slider(e, s)
-        )
+        _SliderEditSync(slider, edit)
 
         return slider, edit
 
+    def append_lines(self, text: str, color: str | None = None) -> None:
+        """Append *text* (one or more lines) to the results log."""
+        self._results_appender.append(text, color)
+
     def get_sweep_axes(self) -> set[str]:
         """Return set of active sweep axes based on checkboxes."""
         axes: set[str] = set()
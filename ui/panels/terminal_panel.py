@@ -10,13 +10,13 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QPlainTextEdit,
     QPushButton,
     QSpinBox,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
-from PySide6.QtGui import QFont
+from PySide6.QtGui import QTextCursor
 
 from config import (
     BAUD_RATES,
@@ -24,8 +24,10 @@ from config import (
     REPEAT_SEND_DEFAULT_INTERVAL,
     REPEAT_SEND_DEFAULT_PAYLOAD,
     REPEAT_SEND_INTERVAL_RANGE,
+    TERMINAL_MAX_BLOCKS,
 )
-from utils.serial_utils import refresh_port_combobox
+from ui.theme import monospace_font
+from utils.serial_utils import populate_port_combobox
 
 
 class TerminalPanel(QWidget):
@@ -50,7 +52,6 @@ class TerminalPanel(QWidget):
 
         h.addWidget(QLabel("Port:"))
         self.term_port_box = QComboBox()
-        refresh_port_combobox(self.term_port_box)
         self.term_port_box.setMinimumWidth(100)
         h.addWidget(self.term_port_box)
 
@@ -66,11 +67,9 @@ class TerminalPanel(QWidget):
         h.addStretch()
 
         self.btn_term_connect = QPushButton("Connect")
-        self.btn_term_connect.setStyleSheet("background-color: #1b5e20; color: white;")
+        self.btn_term_connect.setObjectName("btn_term_connect")
         self.btn_term_disconnect = QPushButton("Disconnect")
-        self.btn_term_disconnect.setStyleSheet(
-            "background-color: #bf360c; color: white;"
-        )
+        self.btn_term_disconnect.setObjectName("btn_term_disconnect")
         h.addWidget(self.btn_term_connect)
         h.addWidget(self.btn_term_disconnect)
 
@@ -90,13 +89,11 @@ class TerminalPanel(QWidget):
         h.addWidget(self.test_mode_box)
 
         self.btn_send_mode = QPushButton("Send MODE")
-        self.btn_send_mode.setStyleSheet("background-color: #1565c0; color: white;")
+        self.btn_send_mode.setObjectName("btn_send_mode")
         h.addWidget(self.btn_send_mode)
 
         self.btn_send_signal = QPushButton("Send START Signal")
-        self.btn_send_signal.setStyleSheet(
-            "background-color: #2e7d32; color: white; font-weight: bold;"
-        )
+        self.btn_send_signal.setObjectName("btn_send_signal")
         h.addWidget(self.btn_send_signal)
         h.addStretch()
 
@@ -110,21 +107,26 @@ class TerminalPanel(QWidget):
         header.addWidget(QLabel("Terminal Log:"))
 
         self.btn_export_terminal_csv = QPushButton("Export CSV")
-        self.btn_export_terminal_csv.setStyleSheet(
-            "background-color: #1565c0; color: white;"
-        )
+        self.btn_export_terminal_csv.setObjectName("btn_export_terminal_csv")
         self.btn_export_terminal_csv.setFixedHeight(24)
         header.addWidget(self.btn_export_terminal_csv)
         header.addStretch()
 
         parent_layout.addLayout(header)
 
-        self.terminal_output = QTextEdit()
+        self.terminal_output = QPlainTextEdit()
         self.terminal_output.setReadOnly(True)
-        self.terminal_output.setFont(QFont("Consolas", 10))
-        self.terminal_output.setStyleSheet("background-color: #1e1e1e; color: #00ff00;")
+        self.terminal_output.setUndoRedoEnabled(False)
+        self.terminal_output.setMaximumBlockCount(TERMINAL_MAX_BLOCKS)
+        self.terminal_output.setFont(monospace_font(10))
+        self.terminal_output.setObjectName("terminal_output")
         parent_layout.addWidget(self.terminal_output)
 
+        # Persistent insertion cursor for RX data, independent of where the
+        # user clicks or selects in the view.
+        self.output_cursor = QTextCursor(self.terminal_output.document())
+        self.output_cursor.movePosition(QTextCursor.End)
+
     # ------------------------------------------------------------------
     # Command input
     # ------------------------------------------------------------------
@@ -132,13 +134,13 @@ class TerminalPanel(QWidget):
         h = QHBoxLayout()
 
         self.terminal_input = QLineEdit()
-        self.terminal_input.setFont(QFont("Consolas", 10))
+        self.terminal_input.setFont(monospace_font(10))
         self.terminal_input.setPlaceholderText(
             "Enter command and press Enter or Send..."
         )
 
         self.btn_send_cmd = QPushButton("Send")
-        self.btn_send_cmd.setStyleSheet("background-color: #01579b; color: white;")
+        self.btn_send_cmd.setObjectName("btn_send_cmd")
         self.btn_clear_term = QPushButton("Clear")
 
         h.addWidget(self.terminal_input)
@@ -168,9 +170,9 @@ class TerminalPanel(QWidget):
         grid.addWidget(self.repeat_interval_spin, 1, 1)
 
         self.btn_repeat_start = QPushButton("Start Repeat")
-        self.btn_repeat_start.setStyleSheet("background-color: #6a1b9a; color: white;")
+        self.btn_repeat_start.setObjectName("btn_repeat_start")
         self.btn_repeat_stop = QPushButton("Stop")
-        self.btn_repeat_stop.setStyleSheet("background-color: #424242; color: white;")
+        self.btn_repeat_stop.setObjectName("btn_repeat_stop")
         self.btn_repeat_stop.setEnabled(False)
         grid.addWidget(self.btn_repeat_start, 1, 2)
         grid.addWidget(self.btn_repeat_stop, 1, 3)
@@ -180,5 +182,5 @@ class TerminalPanel(QWidget):
     # ------------------------------------------------------------------
     # Public helpers
     # ------------------------------------------------------------------
-    def refresh_ports(self) -> None:
-        refresh_port_combobox(self.term_port_box)
+    def set_ports(self, ports: list[str]) -> None:
+        populate_port_combobox(self.term_port_box, ports)
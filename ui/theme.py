@@ -1,15 +1,84 @@
 """
-Dark-theme QSS stylesheet for the application.
+Dark theme for the application: a QPalette plus a QSS stylesheet.
 
 Extracted from MainWindow.apply_dark_theme() so it can be reused or
-swapped without touching widget code.
+swapped without touching widget code.  Base window/text/button colors
+live in the palette (a plain lookup per widget); the stylesheet only
+carries what a palette cannot express (borders, radii, padding, tab and
+scrollbar shapes) and the widget-specific colors, as object-name rules,
+so panels only call ``setObjectName``.  ``apply_theme()`` installs both
+once on the application, on the Fusion style unless
+``config.UI_FUSION_STYLE`` is off.  The monospace font used by the terminal and
+sweep views is shared the same way through ``monospace_font()``.
 """
 
+from functools import lru_cache
+
+from PySide6.QtGui import QColor, QFont, QPalette
+from PySide6.QtWidgets import QApplication
+
+from config import UI_FUSION_STYLE
+
+MONO_FONT_FAMILY = "Consolas"
+
+
+@lru_cache(maxsize=None)
+def monospace_font(point_size: int) -> QFont:
+    """
+    Return the shared monospace ``QFont`` for *point_size*.
+
+    Built on first use (after the QApplication exists) and reused by every
+    widget of that size; ``setFont`` copies are implicitly shared.
+    """
+    return QFont(MONO_FONT_FAMILY, point_size)
+
+
+def dark_palette() -> QPalette:
+    """
+    Return the base colors of the dark theme as a ``QPalette``.
+
+    Window/base/button roles share one background and the text roles one
+    foreground (the former ``QWidget { background-color; color }`` rule);
+    selections use the theme's blue accent and the disabled group greys
+    out text and highlights, so no role falls back to a light default.
+    """
+    pal = QPalette()
+    for role, color in (
+        (QPalette.Window, "#121212"),
+        (QPalette.Base, "#121212"),
+        (QPalette.AlternateBase, "#252526"),
+        (QPalette.Button, "#121212"),
+        (QPalette.ToolTipBase, "#121212"),
+        (QPalette.WindowText, "#e0e0e0"),
+        (QPalette.Text, "#e0e0e0"),
+        (QPalette.ButtonText, "#e0e0e0"),
+        (QPalette.ToolTipText, "#e0e0e0"),
+        (QPalette.PlaceholderText, "#777777"),
+        (QPalette.Highlight, "#007acc"),
+        (QPalette.HighlightedText, "#ffffff"),
+    ):
+        pal.setColor(role, QColor(color))  # all color groups
+    for role, color in (
+        (QPalette.WindowText, "#555555"),
+        (QPalette.Text, "#555555"),
+        (QPalette.ButtonText, "#555555"),
+        (QPalette.PlaceholderText, "#444444"),
+        (QPalette.Highlight, "#444444"),
+        (QPalette.HighlightedText, "#888888"),
+    ):
+        pal.setColor(QPalette.Disabled, role, QColor(color))
+    return pal
+
+
+def apply_theme(app: QApplication) -> None:
+    """Install the dark theme on *app*; call once, before building windows."""
+    if UI_FUSION_STYLE:
+        app.setStyle("Fusion")  # honours the whole palette on every platform
+    app.setPalette(dark_palette())
+    app.setStyleSheet(DARK_THEME_QSS)
+
+
 DARK_THEME_QSS = """
-QMainWindow, QWidget {
-    background-color: #121212;
-    color: #e0e0e0;
-}
 QGroupBox {
     border: 1px solid #444;
     border-radius: 6px;
@@ -95,4 +164,115 @@ QDockWidget::title {
     padding-top: 2px;
     border-bottom: 1px solid #444;
 }
+
+/* Per-widget accents, matched by objectName (set in the panels) */
+QPushButton#btn_connect, QPushButton#btn_term_connect {
+    background-color: #1b5e20;
+    color: white;
+}
+QPushButton#btn_disconnect, QPushButton#btn_term_disconnect,
+QPushButton#btn_clear_faults {
+    background-color: #bf360c;
+    color: white;
+}
+QPushButton#btn_reset_device {
+    background-color: #b71c1c;
+    color: white;
+}
+QPushButton#btn_apply_all, QPushButton#btn_send_cmd {
+    background-color: #01579b;
+    color: white;
+}
+QPushButton#btn_send_mode, QPushButton#btn_export_terminal_csv,
+QPushButton#btn_sweep_export {
+    background-color: #1565c0;
+    color: white;
+}
+QPushButton#btn_send_signal {
+    background-color: #2e7d32;
+    color: white;
+    font-weight: bold;
+}
+QPushButton#btn_repeat_start {
+    background-color: #6a1b9a;
+    color: white;
+}
+QPushButton#btn_repeat_stop {
+    background-color: #424242;
+    color: white;
+}
+QPushButton#btn_pulse {
+    background-color: #e64a19;
+    font-weight: bold;
+    color: white;
+}
+QPushButton#btn_mute {
+    background-color: #37474f;
+    color: white;
+}
+QPushButton#btn_mute:checked {
+    background-color: #ffb300;
+    color: black;
+    font-weight: bold;
+}
+QPushButton#btn_sweep_start, QPushButton#btn_sweep_stop {
+    color: white;
+    font-weight: bold;
+    font-size: 14px;
+}
+QPushButton#btn_sweep_start { background-color: #00695c; }
+QPushButton#btn_sweep_stop { background-color: #b71c1c; }
+QComboBox#probe_tip_box { font-weight: bold; }
+QLabel#pw_limits_label {
+    color: #ffab40;
+    font-size: 11px;
+}
+QLabel#sweep_info_label {
+    color: #ffab40;
+    font-weight: bold;
+    padding: 4px;
+}
+QLabel#sweep_status_label { color: #aaa; }
+QCheckBox#chk_sweep_voltage, QCheckBox#chk_sweep_pw, QCheckBox#chk_sweep_delay {
+    font-weight: bold;
+}
+QCheckBox#chk_sweep_voltage { color: #4fc3f7; }
+QCheckBox#chk_sweep_pw { color: #81c784; }
+QCheckBox#chk_sweep_delay { color: #ffb74d; }
+QPlainTextEdit#terminal_output, QPlainTextEdit#sweep_results_log {
+    background-color: #1e1e1e;
+    color: #00ff00;
+}
+QPlainTextEdit#log_view {
+    background-color: #252526;
+    color: #eee;
+}
+
+/* ARM / DISARM: toggled through the dynamic "state" property */
+QPushButton#btn_arm {
+    background-color: #c62828;
+    color: white;
+    font-weight: 900;
+    font-size: 14px;
+    border: 2px solid #ff8a80;
+}
+QPushButton#btn_arm[state="armed"] {
+    border: 3px solid #ffff00;
+}
+QPushButton#btn_disarm {
+    background-color: #1b5e20;
+    font-weight: 900;
+    color: white;
+    border: 1px solid #66bb6a;
+}
+QPushButton#btn_disarm[state="disarmed"] {
+    font-size: 14px;
+    border: 2px solid #66bb6a;
+}
+QPushButton#btn_disarm[state="armed"] {
+    background-color: #00c853;
+    color: black;
+    font-size: 14px;
+    border: 2px solid #69f0ae;
+}
 """
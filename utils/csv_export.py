@@ -1,15 +1,28 @@
 """
 CSV export utilities.
 
-Stateless helper functions for exporting log text and sweep results to CSV.
+Helper functions for exporting log text and sweep results to CSV, plus
+``SweepCsvWriter`` for streaming sweep results while a sweep runs.
 """
 
 import csv
+import re
 import time
+from collections.abc import Iterable, Iterator
+
+# Write buffer for exports; large logs reach the OS in few write() calls.
+_BUFSIZE = 1 << 16
+
+# "[timestamp] message" log-line prefix
+_TS_PREFIX = re.compile(r"\[([^\]]*)\](.*)")
+
+
+def _iter_lines(text: str | Iterable[str]) -> Iterable[str]:
+    return text.splitlines() if isinstance(text, str) else text
 
 
 def export_text_log_to_csv(
-    text: str, file_path: str, header: list[str] | None = None
+    text: str | Iterable[str], file_path: str, header: list[str] | None = None
 ) -> None:
     """
     Export plain-text log content to a CSV file.
@@ -19,8 +32,9 @@ def export_text_log_to_csv(
 
     Parameters
     ----------
-    text : str
-        The full plain-text log content.
+    text : str | Iterable[str]
+        The full plain-text log content, or an iterable of its lines
+        (e.g. streamed from a text document without building one string).
     file_path : str
         Destination CSV path.
     header : list[str] | None
@@ -29,33 +43,85 @@ def export_text_log_to_csv(
     if header is None:
         header = ["timestamp", "message", "raw"]
 
-    with open(file_path, "w", newline="", encoding="utf-8-sig") as f:
+    with open(
+        file_path, "w", newline="", encoding="utf-8-sig", buffering=_BUFSIZE
+    ) as f:
         writer = csv.writer(f)
         writer.writerow(header)
-        for line in text.splitlines():
-            clean = line.strip()
-            if not clean:
-                continue
-            ts = ""
-            msg = clean
-            if clean.startswith("[") and "]" in clean:
-                idx = clean.find("]")
-                ts = clean[1:idx]
-                msg = clean[idx + 1 :].strip()
-            writer.writerow([ts, msg, clean])
-
-
-def export_raw_lines_to_csv(text: str, file_path: str) -> None:
-    """Export raw text lines (e.g. terminal output) to a single-column CSV."""
-    with open(file_path, "w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.writer(f)
-        for line in text.splitlines():
-            clean = line.strip()
-            if clean:
-                writer.writerow([clean])
+        writer.writerows(_log_rows(text))
+
+
+def _log_rows(text: str | Iterable[str]) -> Iterator[tuple[str, str, str]]:
+    """Yield ``(timestamp, message, raw)`` rows for the non-empty lines of *text*."""
+    match = _TS_PREFIX.match
+    for line in _iter_lines(text):
+        clean = line.strip()
+        if not clean:
+            continue
+        m = match(clean)
+        if m:
+            yield m[1], m[2].strip(), clean
+        else:
+            yield "", clean, clean
+
+
+def export_raw_lines_to_csv(text: str | Iterable[str], file_path: str) -> None:
+    """
+    Export raw text lines (e.g. terminal output) to a single-column CSV.
+
+    *text* is either the full text or an iterable of its lines.
+    """
+    with open(
+        file_path, "w", newline="", encoding="utf-8-sig", buffering=_BUFSIZE
+    ) as f:
+        csv.writer(f).writerows(
+            (clean,) for line in _iter_lines(text) if (clean := line.strip())
+        )
+
+
+_SWEEP_HEADER = (
+    "voltage_V",
+    "pulse_width_ns",
+    "delay_us",
+    "glitches",
+    "resets",
+    "errors",
+    "normal",
+    "total",
+    "glitch_rate",
+    "glitch_cts",
+    "glitch_bits",
+    "last_ct",
+)
 
 
-def export_sweep_results_to_csv(results: list[dict], file_path: str) -> None:
+def _sweep_row(r: dict) -> tuple:
+    return (
+        r["voltage"],
+        r["pulse_width"],
+        r.get("delay_us", 0),
+        r["glitches"],
+        r.get("resets", 0),
+        r["errors"],
+        r["normal"],
+        r["total"],
+        r["rate"],
+        r.get("glitch_cts", ""),
+        r.get("glitch_bits", ""),
+        r.get("last_ct", ""),
+    )
+
+
+def _write_sweep_header(f, writer, notes: Iterable[str]) -> None:
+    """Write ``# note`` preamble lines (if any), then the column header."""
+    for note in notes:
+        f.write(f"# {note}\n")
+    writer.writerow(_SWEEP_HEADER)
+
+
+def export_sweep_results_to_csv(
+    results: list[dict], file_path: str, notes: Iterable[str] = ()
+) -> None:
     """
     Export sweep result dicts to a CSV with a fixed header.
 
@@ -65,40 +131,50 @@ def export_sweep_results_to_csv(results: list[dict], file_path: str) -> None:
         Each dict must contain keys matching the CSV columns.
     file_path : str
         Destination CSV path.
+    notes : Iterable[str]
+        Optional lines written as ``# note`` before the header, e.g. grid
+        points that the sweep did not visit.
     """
-    with open(file_path, "w", newline="", encoding="utf-8-sig") as f:
+    with open(
+        file_path, "w", newline="", encoding="utf-8-sig", buffering=_BUFSIZE
+    ) as f:
         writer = csv.writer(f)
-        writer.writerow(
-            [
-                "voltage_V",
-                "pulse_width_ns",
-                "delay_us",
-                "glitches",
-                "resets",
-                "errors",
-                "normal",
-                "total",
-                "glitch_rate",
-                "glitch_cts",
-                "last_ct",
-            ]
+        _write_sweep_header(f, writer, notes)
+        writer.writerows(_sweep_row(r) for r in results)
+
+
+class SweepCsvWriter:
+    """
+    Append sweep results to a CSV file while the sweep runs.
+
+    Uses the same columns and ``notes`` preamble as
+    ``export_sweep_results_to_csv``.  Each row is
+    flushed to the OS as soon as it is written (points are seconds apart),
+    so a crash or power loss keeps every completed point.  Use as a
+    context manager or call ``close()``.
+    """
+
+    def __init__(self, file_path: str, notes: Iterable[str] = ()) -> None:
+        self.file_path = file_path
+        self._f = open(
+            file_path, "w", newline="", encoding="utf-8-sig", buffering=_BUFSIZE
         )
-        for r in results:
-            writer.writerow(
-                [
-                    r["voltage"],
-                    r["pulse_width"],
-                    r.get("delay_us", 0),
-                    r["glitches"],
-                    r.get("resets", 0),
-                    r["errors"],
-                    r["normal"],
-                    r["total"],
-                    r["rate"],
-                    r.get("glitch_cts", ""),
-                    r.get("last_ct", ""),
-                ]
-            )
+        self._writer = csv.writer(self._f)
+        _write_sweep_header(self._f, self._writer, notes)
+        self._f.flush()
+
+    def write(self, result: dict) -> None:
+        self._writer.writerow(_sweep_row(result))
+        self._f.flush()
+
+    def close(self) -> None:
+        self._f.close()
+
+    def __enter__(self) -> "SweepCsvWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
 
 def default_filename(prefix: str) -> str:
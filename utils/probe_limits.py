@@ -0,0 +1,48 @@
+"""
+Probe-tip pulse-width limit lookup.
+
+Pure helpers over ``config.PROBE_LIMITS``.  Each interpolation table is
+split once at import time into parallel tuples (voltages, pw_min, pw_max)
+so the bracketing voltage pair is found with a binary search instead of a
+linear scan.
+"""
+
+from bisect import bisect_right
+
+from config import PROBE_LIMITS
+
+DEFAULT_PROBE = "4mm"
+
+_TABLES: dict[str, tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]]] = {
+    name: tuple(zip(*info["table"])) for name, info in PROBE_LIMITS.items()
+}
+
+_PW_ENVELOPE: dict[str, tuple[int, int]] = {
+    name: (min(pw_mins), max(pw_maxs))
+    for name, (_, pw_mins, pw_maxs) in _TABLES.items()
+}
+
+
+def pw_limits_for_voltage(voltage: int, probe: str) -> tuple[int, int]:
+    """
+    Return the ``(pw_min, pw_max)`` pulse-width bounds in ns for *voltage*.
+
+    The voltage is clamped to the probe table and the bounds are linearly
+    interpolated between the two bracketing entries.  Unknown probes fall
+    back to ``DEFAULT_PROBE``.
+    """
+    volts, pw_mins, pw_maxs = _TABLES.get(probe, _TABLES[DEFAULT_PROBE])
+    v = max(volts[0], min(volts[-1], voltage))
+    i = bisect_right(volts, v) - 1
+    if i >= len(volts) - 1:
+        return pw_mins[-1], pw_maxs[-1]
+    v0, v1 = volts[i], volts[i + 1]
+    t = (v - v0) / (v1 - v0)
+    pw_min = int(round(pw_mins[i] + t * (pw_mins[i + 1] - pw_mins[i])))
+    pw_max = int(round(pw_maxs[i] + t * (pw_maxs[i + 1] - pw_maxs[i])))
+    return pw_min, pw_max
+
+
+def pw_envelope(probe: str) -> tuple[int, int]:
+    """Return the overall ``(pw_min, pw_max)`` across all voltages for *probe*."""
+    return _PW_ENVELOPE.get(probe, _PW_ENVELOPE[DEFAULT_PROBE])
@@ -1,25 +1,149 @@
 """
 Serial port utility functions.
 
-Pure helper functions with no dependency on business logic or UI.
+Pure helpers with no dependency on business logic or UI.
 """
 
+import os
+import sys
+import time
+from collections.abc import Iterator
+
 import serial.tools.list_ports
 
 
-def list_serial_ports() -> list[str]:
-    """Return a list of available serial port device names."""
-    return [port.device for port in serial.tools.list_ports.comports()]
+# Both port combos refresh at startup and on button clicks; one OS scan
+# serves any refresh within this window.
+_PORTS_CACHE_TTL_S = 0.5
+_NO_PORTS = "No ports found"
+
+# Windows driver RX queue (SetupComm); the default 4 KiB can overflow on
+# a burst while the reader thread is descheduled.
+_WIN_RX_BUFFER = 1 << 16
+
+_ports_cache: tuple[float, tuple[str, ...]] = (float("-inf"), ())
+
+
+def list_serial_ports(max_age: float = _PORTS_CACHE_TTL_S) -> list[str]:
+    """
+    Return a list of available serial port device names.
+
+    Results younger than *max_age* seconds are reused instead of
+    re-enumerating the OS devices (which can take 50-200 ms on Windows).
+    """
+    global _ports_cache
+    now = time.monotonic()
+    stamp, ports = _ports_cache
+    if now - stamp >= max_age:
+        ports = tuple(port.device for port in serial.tools.list_ports.comports())
+        _ports_cache = (now, ports)
+    return list(ports)
 
 
-def refresh_port_combobox(combo_box) -> None:
-    """Refresh a QComboBox with available serial ports, preserving selection."""
+def populate_port_combobox(combo_box, ports: list[str]) -> None:
+    """
+    Show *ports* in a QComboBox, preserving the current selection.
+
+    Only ports that appeared or disappeared are inserted/removed, so an
+    unchanged list leaves the combo (and its layout) untouched.  Signals are
+    blocked while editing; if the selection ends up different, the change
+    signals are emitted once afterwards.
+    """
+    ports = ports or [_NO_PORTS]
+    items = [combo_box.itemText(i) for i in range(combo_box.count())]
+    if items == ports:
+        return
+
     current = combo_box.currentText()
-    combo_box.clear()
-    ports = list_serial_ports()
-    if ports:
-        combo_box.addItems(ports)
-        if current in ports:
+    wanted = set(ports)
+    present = set(items)
+    was_blocked = combo_box.blockSignals(True)
+    try:
+        for i in reversed(range(len(items))):
+            if items[i] not in wanted:
+                combo_box.removeItem(i)
+        for i, port in enumerate(ports):
+            if port not in present:
+                combo_box.insertItem(i, port)
+        if current in wanted:
             combo_box.setCurrentText(current)
-    else:
-        combo_box.addItems(["No ports found"])
+    finally:
+        combo_box.blockSignals(was_blocked)
+
+    text = combo_box.currentText()
+    if text != current and not was_blocked:
+        combo_box.currentIndexChanged.emit(combo_box.currentIndex())
+        combo_box.currentTextChanged.emit(text)
+
+
+def set_low_latency(ser) -> bool:
+    """
+    Best-effort request for low-latency delivery on an open ``serial.Serial``.
+
+    Sets the kernel ``ASYNC_LOW_LATENCY`` flag where pyserial supports it
+    and, on Linux, lowers the USB-serial (FTDI) ``latency_timer`` from the
+    default 16 ms to 1 ms.  On Windows, where the FTDI latency timer is a
+    driver setting, the driver RX queue is enlarged instead.  Failures
+    (unsupported driver, no permission) are ignored.  Returns True if any
+    setting was applied.
+    """
+    applied = False
+    set_mode = getattr(ser, "set_low_latency_mode", None)  # POSIX only
+    if set_mode is not None:
+        try:
+            set_mode(True)
+            applied = True
+        except (OSError, ValueError):
+            pass
+
+    if sys.platform.startswith("linux") and ser.port:
+        name = os.path.basename(os.path.realpath(ser.port))
+        try:
+            with open(f"/sys/bus/usb-serial/devices/{name}/latency_timer", "w") as f:
+                f.write("1")
+            applied = True
+        except OSError:
+            pass
+
+    set_buffer_size = getattr(ser, "set_buffer_size", None)  # Windows only
+    if set_buffer_size is not None:
+        try:
+            set_buffer_size(rx_size=_WIN_RX_BUFFER)
+            applied = True
+        except (OSError, ValueError):
+            pass
+    return applied
+
+
+class LineBuffer:
+    """
+    Accumulate raw serial bytes and split them into complete lines.
+
+    ``serial.Serial.readline()`` reads one byte per call; filling from
+    ``in_waiting`` instead keeps the number of reads proportional to the
+    number of lines rather than the number of bytes.
+    """
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+
+    def clear(self) -> None:
+        """Drop any buffered (partial) data, e.g. after ``reset_input_buffer``."""
+        self._buf.clear()
+
+    def fill(self, ser) -> int:
+        """
+        Read everything currently waiting on *ser* (or block for one byte up
+        to the port timeout) and return the number of bytes appended.
+        """
+        chunk = ser.read(ser.in_waiting or 1)
+        self._buf += chunk
+        return len(chunk)
+
+    def lines(self) -> Iterator[bytes]:
+        """Yield complete lines (without the trailing newline) from the buffer."""
+        buf = self._buf
+        while (idx := buf.find(b"\n")) != -1:
+            line = bytes(buf[:idx])
+            del buf[: idx + 1]
+            yield line
@@ -3,5 +3,6 @@
 from workers.shouter_worker import ShouterWorker
 from workers.serial_worker import SerialTerminalWorker
 from workers.sweep_worker import SweepWorker
+from workers.port_scanner import PortScanner
 
-__all__ = ["ShouterWorker", "SerialTerminalWorker", "SweepWorker"]
+__all__ = ["ShouterWorker", "SerialTerminalWorker", "SweepWorker", "PortScanner"]
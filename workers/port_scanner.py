@@ -0,0 +1,36 @@
+"""
+PortScanner – serial port enumeration on the global QThreadPool.
+
+``serial.tools.list_ports.comports()`` walks SetupAPI (Windows) or sysfs
+and can block for hundreds of ms with USB hubs attached, so the scan
+runs on a pool thread and the result is delivered through a signal.
+"""
+
+from PySide6.QtCore import QObject, QThreadPool, Signal
+
+from utils.serial_utils import list_serial_ports
+
+
+class PortScanner(QObject):
+    ports_ready = Signal(list)  # device names, delivered to the owner's thread
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._scanning = False
+
+    def scan(self) -> bool:
+        """Start a scan unless one is already running; return True if started."""
+        if self._scanning:
+            return False
+        self._scanning = True
+        QThreadPool.globalInstance().start(self._run)
+        return True
+
+    def _run(self) -> None:
+        # Pool thread; ports_ready is queued to the scanner's own thread.
+        try:
+            ports = list_serial_ports()
+        except Exception:
+            ports = []
+        self._scanning = False
+        self.ports_ready.emit(ports)
@@ -2,26 +2,64 @@
 SerialTerminalWorker – QObject running on a dedicated QThread.
 
 Manages a raw serial connection to a target board (e.g. KW45).
-Provides connect/disconnect, send, and poll-based read functionality.
+Provides connect/disconnect, send, and a blocking background read loop.
+While the read loop runs, sends are queued and written from the worker
+thread so a stalled port never blocks the GUI.
 """
 
+import threading
+from collections import deque
+
 import serial
 from PySide6.QtCore import QObject, Signal
 
 from config import SERIAL_READ_TIMEOUT
+from utils.serial_utils import set_low_latency
+
+# Upper bound for the read loop to notice a stop request (one read timeout
+# plus slack for the drain read and signal emission).
+_READ_LOOP_STOP_TIMEOUT = SERIAL_READ_TIMEOUT * 5
+
+# Max chunks held for the GUI; the oldest are dropped if it stalls.
+_RX_QUEUE_MAX_CHUNKS = 4096
+
+# Max payloads waiting for the read loop to write them; further sends are
+# rejected (backpressure) instead of piling up behind a stalled port.
+_TX_QUEUE_MAX = 256
+
+# Pre-encoded payloads for the quick-control buttons (MODE / START)
+_FAST_TX = {f"MODE:{m}": f"MODE:{m}\r\n".encode() for m in ("1", "2", "3", "4")}
+_FAST_TX["START"] = b"START\r\n"
+
+# Keep printable ASCII plus CR/LF/TAB; show any other byte as "."
+_PRINTABLE = bytes(
+    b if 0x20 <= b < 0x7F or b in b"\r\n\t" else ord(".") for b in range(256)
+)
 
 
 class SerialTerminalWorker(QObject):
-    data_received = Signal(str)
+    data_available = Signal()  # queue went empty -> non-empty; see take_received()
     status_signal = Signal(str)
 
+    # --- internal trigger signal (queued connection across threads) ---
+    _read_requested = Signal()
+
     def __init__(self) -> None:
         super().__init__()
         self.serial_port: serial.Serial | None = None
         self.is_connected = False
         self.running = False
         self.last_sent_command = ""
-        self.is_reading = False
+        self._read_idle = threading.Event()
+        self._read_idle.set()
+        self._rx_queue: deque[bytes] = deque(maxlen=_RX_QUEUE_MAX_CHUNKS)
+        self._rx_lock = threading.Lock()
+        self._rx_pending = False
+        self._rx_buf = bytearray()  # bytes after the last newline seen
+        self._tx_queue: deque[bytes] = deque()
+        self._tx_lock = threading.Lock()
+        self._tx_woken = False  # read() was cancelled to write, not idle
+        self._read_requested.connect(self.read_loop)
 
     # ------------------------------------------------------------------
     # Connection
@@ -29,6 +67,7 @@ class SerialTerminalWorker(QObject):
     def connect_serial(self, port: str, baudrate: int) -> None:
         try:
             if self.serial_port and self.serial_port.is_open:
+                self._stop_read_loop()
                 self.serial_port.close()
 
             self.serial_port = serial.Serial(
@@ -39,54 +78,173 @@ class SerialTerminalWorker(QObject):
                 stopbits=serial.STOPBITS_ONE,
                 timeout=SERIAL_READ_TIMEOUT,
             )
+            set_low_latency(self.serial_port)
             self.is_connected = True
-            self.running = True
-            self.is_reading = False
             self.status_signal.emit(f"Terminal conectado a {port} @ {baudrate} baud")
+            self.resume_reading()
         except Exception as e:
             self.status_signal.emit(f"Error de conexión: {e}")
 
     def disconnect_serial(self) -> None:
-        self.running = False
-        self.is_reading = False
+        self._stop_read_loop()
         if self.serial_port and self.serial_port.is_open:
             self.serial_port.close()
         self.is_connected = False
         self.serial_port = None
         self.status_signal.emit("Terminal desconectado")
 
+    # ------------------------------------------------------------------
+    # Read loop control
+    # ------------------------------------------------------------------
+    def pause_reading(self) -> None:
+        """Stop the read loop so another worker (e.g. a sweep) can own the port."""
+        self._stop_read_loop()
+
+    def resume_reading(self) -> None:
+        """(Re)start the read loop on the worker thread if the port is open."""
+        if self.running or not self.serial_port or not self.serial_port.is_open:
+            return
+        self.running = True
+        self._read_requested.emit()
+
+    def _stop_read_loop(self) -> None:
+        self.running = False
+        port = self.serial_port
+        if port is not None and port.is_open:
+            try:
+                port.cancel_read()
+            except Exception:
+                pass
+        self._read_idle.wait(_READ_LOOP_STOP_TIMEOUT)
+
+    # ------------------------------------------------------------------
+    # RX queue (worker -> GUI)
+    # ------------------------------------------------------------------
+    def _push_received(self, raw: bytes) -> None:
+        """Queue *raw* bytes for the GUI; signal only when the queue was empty."""
+        with self._rx_lock:
+            self._rx_queue.append(raw)
+            notify = not self._rx_pending
+            self._rx_pending = True
+        if notify:
+            self.data_available.emit()
+
+    def take_received(self) -> str:
+        """
+        Return and clear everything queued since the last call (GUI thread).
+
+        Chunks are queued as raw bytes and decoded here, once per drain.
+        After translation every byte is ASCII, so latin-1 is a plain copy.
+        """
+        with self._rx_lock:
+            chunks = list(self._rx_queue)
+            self._rx_queue.clear()
+            self._rx_pending = False
+        return b"".join(chunks).translate(_PRINTABLE).decode("latin-1")
+
     # ------------------------------------------------------------------
     # Data I/O
     # ------------------------------------------------------------------
     def send_data(self, data: str) -> None:
-        if self.is_connected and self.serial_port:
+        """
+        Send *data* plus CRLF (GUI thread).
+
+        With the read loop running the payload is queued and the blocking
+        ``read()`` is cancelled so the worker thread writes it right away;
+        otherwise (loop paused or stopped) it is written directly.
+        """
+        ser = self.serial_port
+        if not self.is_connected or not ser:
+            return
+        self.last_sent_command = data
+        payload = _FAST_TX.get(data) or (data + "\r\n").encode()
+        if self.running:
+            with self._tx_lock:
+                if len(self._tx_queue) >= _TX_QUEUE_MAX:
+                    self.status_signal.emit("TX descartado: cola de envío llena")
+                    return
+                self._tx_queue.append(payload)
+            self._tx_woken = True
             try:
-                self.last_sent_command = data
-                self.serial_port.write((data + "\r\n").encode())
-                self.data_received.emit(f"> {data}\n")
+                ser.cancel_read()
+            except Exception:
+                pass
+        else:
+            try:
+                ser.write(payload)
             except Exception as e:
                 self.status_signal.emit(f"Error TX: {e}")
+                return
+        self._push_received(b"> " + payload[:-2] + b"\n")
 
-    def read_data(self) -> None:
-        """Called periodically by a QTimer on the main thread."""
-        if self.is_reading:
-            return
-        if (
-            not self.is_connected
-            or not self.serial_port
-            or not self.serial_port.is_open
-        ):
-            return
+    def _flush_tx(self, ser) -> None:
+        """Write all queued payloads (worker thread)."""
+        with self._tx_lock:
+            if not self._tx_queue:
+                return
+            payloads = b"".join(self._tx_queue)
+            self._tx_queue.clear()
+        try:
+            ser.write(payloads)
+        except Exception as e:
+            self.status_signal.emit(f"Error TX: {e}")
+
+    def read_loop(self) -> None:
+        """
+        Blocking read loop; runs on the worker thread until stopped.
 
-        self.is_reading = True
+        Each pass blocks in ``read()`` for up to ``SERIAL_READ_TIMEOUT``
+        waiting for data, then drains anything else already buffered so a
+        burst is emitted as one chunk.  Only complete lines are emitted; a
+        trailing partial line is held until its newline arrives or the
+        port goes idle for one read timeout (e.g. a prompt without LF).
+        """
+        # Mark busy before checking ``running`` so a concurrent stop either
+        # waits for this loop or makes it exit before the first read.
+        self._read_idle.clear()
+        buf = self._rx_buf
         try:
-            if self.serial_port.in_waiting:
-                data = self.serial_port.read(self.serial_port.in_waiting).decode(
-                    errors="ignore"
-                )
-                if data and data.strip():
-                    self.data_received.emit(data)
-        except Exception:
-            pass
+            while self.running:
+                ser = self.serial_port
+                if ser is None or not ser.is_open:
+                    break
+                self._flush_tx(ser)
+                try:
+                    data = ser.read(ser.in_waiting or 1)
+                    if data:
+                        waiting = ser.in_waiting
+                        if waiting:
+                            data += ser.read(waiting)
+                except Exception as e:
+                    if self.running:
+                        self.running = False
+                        self.status_signal.emit(f"Error RX: {e}")
+                    break
+                if data:
+                    buf += data
+                    end = buf.rfind(b"\n") + 1
+                    if not end:
+                        continue
+                elif self._tx_woken:
+                    self._tx_woken = False  # read cancelled by send_data
+                    continue
+                else:
+                    end = len(buf)  # idle: flush a pending partial line
+                    if not end:
+                        continue
+                self._emit_rx(buf[:end])
+                del buf[:end]
         finally:
-            self.is_reading = False
+            # Write sends queued while stopping; emit a leftover partial line.
+            ser = self.serial_port
+            if ser is not None and ser.is_open:
+                self._flush_tx(ser)
+            if buf:
+                self._emit_rx(buf)
+                buf.clear()
+            self._read_idle.set()
+
+    def _emit_rx(self, raw) -> None:
+        # Whitespace-only chunks are dropped; decoding waits for the GUI.
+        if raw.strip(b" \t\r\n"):
+            self._push_received(bytes(raw))
@@ -2,21 +2,26 @@
 ShouterWorker – QObject running on a dedicated QThread.
 
 Handles all ChipSHOUTER serial communication (connect, arm, fire,
-parameter changes, fault reads) via signal/slot pairs so the GUI
-thread never blocks on I/O.
+parameter changes, fault reads) via a single queued ``request``
+signal so the GUI thread never blocks on I/O.
 """
 
+import threading
 import time
+from collections import deque
 
 from PySide6.QtCore import QObject, Signal
 
 from chipshouter import ChipSHOUTER
 from chipshouter.com_tools import Reset_Exception
 
+from config import FAULT_CACHE_TTL_S, FAULT_POLL_INTERVAL_MS
+from utils.serial_utils import set_low_latency
+
 
 class ShouterWorker(QObject):
     # --- outgoing signals (worker -> UI) ---
-    log_signal = Signal(str)
+    logs_available = Signal()  # queue went empty -> non-empty; see take_logs()
     status_signal = Signal(str)
     reset_detected = Signal()
     fault_signal = Signal(str)
@@ -24,23 +29,46 @@ class ShouterWorker(QObject):
     armed_changed = Signal(bool)
     busy_changed = Signal(bool)
 
-    # --- incoming request signals (UI -> worker) ---
-    request_connect = Signal(str)
-    request_disconnect = Signal()
-    request_arm = Signal(bool)
-    request_fire = Signal()
-    request_mute = Signal(bool)
-    request_set_voltage = Signal(int)
-    request_set_pulse_width = Signal(int)
-    request_set_pulse_repeat = Signal(int)
-    request_set_deadtime = Signal(int)
-    request_set_hwtrig_mode = Signal(bool)
-    request_set_hwtrig_term = Signal(bool)
-    request_reset = Signal()
-    request_read_faults_current = Signal(bool)
-    request_read_faults_latched = Signal()
-    request_clear_faults = Signal()
-    request_read_arm_state = Signal()
+    # --- incoming requests (UI -> worker) ---
+    # One queued signal carries (slot name, args); see _dispatch().
+    request = Signal(str, object)
+
+    # Slots reachable through ``request``.
+    _REQUEST_SLOTS = frozenset(
+        {
+            "connect_device",
+            "disconnect_device",
+            "arm_device",
+            "fire_pulse",
+            "toggle_mute",
+            "set_voltage",
+            "set_pulse_width",
+            "set_pulse_repeat",
+            "set_deadtime",
+            "set_hwtrig_mode",
+            "set_hwtrig_term",
+            "apply_all_settings",
+            "reset_device",
+            "read_faults_current",
+            "read_faults_latched",
+            "clear_faults",
+            "poll_status",
+            "_apply_pending_setting",
+        }
+    )
+
+    # Setter slots that may be coalesced: only the latest value is applied.
+    _COALESCED_SETTERS = frozenset(
+        {
+            "set_voltage",
+            "set_pulse_width",
+            "set_pulse_repeat",
+            "set_deadtime",
+            "set_hwtrig_mode",
+            "set_hwtrig_term",
+            "apply_all_settings",
+        }
+    )
 
     def __init__(self) -> None:
         super().__init__()
@@ -48,26 +76,44 @@ class ShouterWorker(QObject):
         self.is_connected = False
         self.is_armed = False
         self.is_busy = False
+        self._can_run = False  # connected and not busy; see _set_busy/_set_connected
         self.current_port = ""
-        self._last_faults_current = None
-
-        # Wire incoming signals to slots
-        self.request_connect.connect(self.connect_device)
-        self.request_disconnect.connect(self.disconnect_device)
-        self.request_arm.connect(self.arm_device)
-        self.request_fire.connect(self.fire_pulse)
-        self.request_mute.connect(self.toggle_mute)
-        self.request_set_voltage.connect(self.set_voltage)
-        self.request_set_pulse_width.connect(self.set_pulse_width)
-        self.request_set_pulse_repeat.connect(self.set_pulse_repeat)
-        self.request_set_deadtime.connect(self.set_deadtime)
-        self.request_set_hwtrig_mode.connect(self.set_hwtrig_mode)
-        self.request_set_hwtrig_term.connect(self.set_hwtrig_term)
-        self.request_reset.connect(self.reset_device)
-        self.request_read_faults_current.connect(self.read_faults_current)
-        self.request_read_faults_latched.connect(self.read_faults_latched)
-        self.request_clear_faults.connect(self.clear_faults)
-        self.request_read_arm_state.connect(self.read_arm_state)
+        self._last_faults_current: tuple[str, ...] | None = None
+        self._faults_raw = None  # cs.faults_current value behind _last_faults_current
+        self._faults_ts = 0.0
+        self._faults_dirty = True
+        self._last_status = ""
+        self._pending_settings: dict[str, object] = {}
+        self._pending_lock = threading.Lock()
+        self._log_queue: deque[str] = deque()
+        self._log_lock = threading.Lock()
+        self._log_pending = False
+        # Bound methods resolved once; _dispatch is a single dict lookup.
+        self._request_slots = {
+            name: getattr(self, name) for name in self._REQUEST_SLOTS
+        }
+
+        self.request.connect(self._dispatch)
+
+    # ------------------------------------------------------------------
+    # Log queue (worker -> GUI)
+    # ------------------------------------------------------------------
+    def _log(self, text: str) -> None:
+        """Queue a log line; the GUI is signalled only when the queue was empty."""
+        with self._log_lock:
+            self._log_queue.append(text)
+            notify = not self._log_pending
+            self._log_pending = True
+        if notify:
+            self.logs_available.emit()
+
+    def take_logs(self) -> list[str]:
+        """Return and clear all queued log lines (GUI thread)."""
+        with self._log_lock:
+            lines = list(self._log_queue)
+            self._log_queue.clear()
+            self._log_pending = False
+        return lines
 
     # ------------------------------------------------------------------
     # Internal state helpers
@@ -75,11 +121,13 @@ class ShouterWorker(QObject):
     def _set_busy(self, busy: bool) -> None:
         if self.is_busy != busy:
             self.is_busy = busy
+            self._can_run = self.is_connected and not busy
             self.busy_changed.emit(busy)
 
     def _set_connected(self, connected: bool, port: str = "") -> None:
         if self.is_connected != connected or self.current_port != port:
             self.is_connected = connected
+            self._can_run = connected and not self.is_busy
             self.current_port = port
             self.connection_changed.emit(connected, port)
 
@@ -88,7 +136,57 @@ class ShouterWorker(QObject):
             self.is_armed = armed
             self.armed_changed.emit(armed)
 
+    def _publish_faults(self, faults: tuple[str, ...] | None, raw=None) -> None:
+        self._faults_raw = raw
+        self._last_faults_current = faults
+
+    def _set_status(self, status: str) -> None:
+        if self._last_status != status:
+            self._last_status = status
+            self.status_signal.emit(status)
+
+    # ------------------------------------------------------------------
+    # Request dispatch
+    # ------------------------------------------------------------------
+    def _dispatch(self, name: str, args) -> None:
+        """
+        Run the slot *name* on the worker thread.
+
+        *args* is a tuple of positional arguments, or a single argument.
+        """
+        slot = self._request_slots.get(name)
+        if slot is None:
+            self._log(f"Petición desconocida: {name}")
+            return
+        if isinstance(args, tuple):
+            slot(*args)
+        else:
+            slot(args)
+
+    def submit_setting(self, setter: str, value) -> None:
+        """
+        Queue a setter call (e.g. ``"set_voltage"``) from the GUI thread.
+
+        Repeated submissions for the same setter before the worker runs it
+        collapse to the latest value; the call keeps the queue position of
+        the first submission, so ordering against other requests holds.
+        """
+        if setter not in self._COALESCED_SETTERS:
+            raise ValueError(f"Unknown setter: {setter}")
+        with self._pending_lock:
+            first = setter not in self._pending_settings
+            self._pending_settings[setter] = value
+        if first:
+            self.request.emit("_apply_pending_setting", setter)
+
+    def _apply_pending_setting(self, setter: str) -> None:
+        with self._pending_lock:
+            value = self._pending_settings.pop(setter, None)
+        if value is not None:
+            self._request_slots[setter](value)
+
     def _handle_reset(self) -> None:
+        self._faults_dirty = True
         self._set_armed(False)
         self.reset_detected.emit()
 
@@ -96,26 +194,23 @@ class ShouterWorker(QObject):
     # Connection
     # ------------------------------------------------------------------
     def connect_device(self, port: str) -> None:
-        if self.is_busy:
-            self.log_signal.emit("Sistema ocupado, espere...")
-            return
         self._set_busy(True)
         try:
             self.cs = ChipSHOUTER(port)
+            set_low_latency(self.cs.com_api.s)
+            self._faults_dirty = True
             self._set_connected(True, port)
             self._set_armed(False)
-            self.log_signal.emit(f"Conectado a {port}")
+            self._log(f"Conectado a {port}")
         except Exception as e:
             self.cs = None
             self._set_connected(False, "")
             self._set_armed(False)
-            self.log_signal.emit(f"Error de conexión: {e}")
+            self._log(f"Error de conexión: {e}")
         finally:
             self._set_busy(False)
 
     def disconnect_device(self) -> None:
-        if self.is_busy:
-            return
         self._set_busy(True)
         try:
             if self.is_connected and self.cs:
@@ -126,10 +221,10 @@ class ShouterWorker(QObject):
             self.cs = None
             self._set_armed(False)
             self._set_connected(False, "")
-            self.status_signal.emit("DESCONECTADO")
-            self.log_signal.emit("Dispositivo desconectado")
+            self._set_status("DESCONECTADO")
+            self._log("Dispositivo desconectado")
         except Exception as e:
-            self.log_signal.emit(f"Error al desconectar: {e}")
+            self._log(f"Error al desconectar: {e}")
         finally:
             self._set_busy(False)
 
@@ -137,36 +232,38 @@ class ShouterWorker(QObject):
     # Arm / fire / mute
     # ------------------------------------------------------------------
     def arm_device(self, should_arm: bool) -> None:
-        if not self.is_connected:
+        if not self._can_run:
             return
+        self._faults_dirty = True
         try:
             self.cs.armed = 1 if should_arm else 0
             self._set_armed(should_arm)
             state = "ARMADO (PELIGRO)" if should_arm else "DESARMADO"
-            self.status_signal.emit(state)
-            self.log_signal.emit(f"Estado cambiado: {state}")
+            self._set_status(state)
+            self._log(f"Estado cambiado: {state}")
         except Reset_Exception:
             self._handle_reset()
         except Exception as e:
             self._set_armed(False)
-            self.log_signal.emit(f"Error al cambiar armado: {e}")
+            self._log(f"Error al cambiar armado: {e}")
 
     def fire_pulse(self) -> None:
-        if not self.is_connected:
+        if not self._can_run:
             return
+        self._faults_dirty = True
         try:
             self.cs.pulse = 1
-            self.log_signal.emit("¡Pulso disparado!")
+            self._log("¡Pulso disparado!")
         except Reset_Exception:
             self._handle_reset()
 
     def toggle_mute(self, mute_enabled: bool) -> None:
-        if not self.is_connected:
+        if not self._can_run:
             return
         try:
             self.cs.mute = 1 if mute_enabled else 0
             state = "SILENCIADO" if mute_enabled else "SONIDO HABILITADO"
-            self.log_signal.emit(f"Estado de sonido: {state}")
+            self._log(f"Estado de sonido: {state}")
         except Reset_Exception:
             self._handle_reset()
 
@@ -174,67 +271,98 @@ class ShouterWorker(QObject):
     # Parameter setters
     # ------------------------------------------------------------------
     def set_voltage(self, voltage: int) -> None:
-        if not self.is_connected:
+        if not self._can_run:
             return
         try:
             self.cs.voltage = voltage
-            self.log_signal.emit(f"Voltaje configurado: {voltage}V")
+            self._log(f"Voltaje configurado: {voltage}V")
         except Reset_Exception:
             self._handle_reset()
 
     def set_pulse_width(self, width: int) -> None:
-        if not self.is_connected:
+        if not self._can_run:
             return
         try:
             self.cs.pulse.width = width
-            self.log_signal.emit(f"Ancho de pulso configurado: {width}ns")
+            self._log(f"Ancho de pulso configurado: {width}ns")
         except Reset_Exception:
             self._handle_reset()
 
     def set_pulse_repeat(self, repeat: int) -> None:
-        if not self.is_connected:
+        if not self._can_run:
             return
         try:
             self.cs.pulse.repeat = repeat
-            self.log_signal.emit(f"Repeticiones configuradas: {repeat}")
+            self._log(f"Repeticiones configuradas: {repeat}")
         except Reset_Exception:
             self._handle_reset()
 
     def set_deadtime(self, deadtime: int) -> None:
-        if not self.is_connected:
+        if not self._can_run:
             return
         try:
             self.cs.pulse.deadtime = deadtime
-            self.log_signal.emit(f"Deadtime configurado: {deadtime}ms")
+            self._log(f"Deadtime configurado: {deadtime}ms")
         except Reset_Exception:
             self._handle_reset()
 
     def set_hwtrig_mode(self, active_high: bool) -> None:
-        if not self.is_connected:
+        if not self._can_run:
             return
         try:
             self.cs.hwtrig_mode = active_high
             mode_str = "Active-High" if active_high else "Active-Low"
-            self.log_signal.emit(f"HW Trigger Mode: {mode_str}")
+            self._log(f"HW Trigger Mode: {mode_str}")
         except Reset_Exception:
             self._handle_reset()
 
     def set_hwtrig_term(self, term_50ohm: bool) -> None:
-        if not self.is_connected:
+        if not self._can_run:
             return
         try:
             self.cs.hwtrig_term = term_50ohm
             term_str = "50-ohm" if term_50ohm else "High Impedance (~1.8K-ohm)"
-            self.log_signal.emit(f"HW Trigger Termination: {term_str}")
+            self._log(f"HW Trigger Termination: {term_str}")
+        except Reset_Exception:
+            self._handle_reset()
+
+    def apply_all_settings(self, settings: dict) -> None:
+        """
+        Apply voltage, pulse and HW-trigger settings in one worker call.
+
+        *settings* carries ``voltage``, ``pulse_width``, ``pulse_repeat``,
+        ``deadtime``, ``hwtrig_mode`` (active-high) and ``hwtrig_term``
+        (50-ohm).  Emits a single summary log line.
+        """
+        if not self._can_run:
+            return
+        try:
+            cs = self.cs
+            cs.voltage = settings["voltage"]
+            cs.pulse.width = settings["pulse_width"]
+            cs.pulse.repeat = settings["pulse_repeat"]
+            cs.pulse.deadtime = settings["deadtime"]
+            cs.hwtrig_mode = settings["hwtrig_mode"]
+            cs.hwtrig_term = settings["hwtrig_term"]
+            mode_str = "Active-High" if settings["hwtrig_mode"] else "Active-Low"
+            term_str = "50-ohm" if settings["hwtrig_term"] else "High-Z"
+            self._log(
+                f"Configuración aplicada: {settings['voltage']}V, "
+                f"{settings['pulse_width']}ns, x{settings['pulse_repeat']}, "
+                f"deadtime {settings['deadtime']}ms, HW Trigger {mode_str}/{term_str}"
+            )
         except Reset_Exception:
             self._handle_reset()
+        except Exception as e:
+            self._log(f"Error aplicando configuración: {e}")
 
     def reset_device(self) -> None:
-        if not self.is_connected:
+        if not self._can_run:
             return
+        self._faults_dirty = True
         try:
             self.cs.reset = True
-            self.log_signal.emit("Hardware reset enviado")
+            self._log("Hardware reset enviado")
         except Reset_Exception:
             self._handle_reset()
 
@@ -242,17 +370,29 @@ class ShouterWorker(QObject):
     # Fault management
     # ------------------------------------------------------------------
     def read_faults_current(self, manual: bool = False) -> None:
-        if not self.is_connected:
+        if not self._can_run:
+            return
+        # Automatic polls skip the round-trip if nothing could have changed.
+        if (
+            not manual
+            and not self._faults_dirty
+            and time.monotonic() - self._faults_ts < FAULT_CACHE_TTL_S
+        ):
             return
         try:
             faults = self.cs.faults_current
-            fault_key = tuple(str(f) for f in faults) if faults else ()
+            self._faults_ts = time.monotonic()
+            self._faults_dirty = False
+            # Same reply as the last published read: skip re-stringifying it.
+            if not manual and faults == self._faults_raw:
+                return
+            fault_key = tuple(map(str, faults)) if faults else ()
             if fault_key != self._last_faults_current or manual:
-                self._last_faults_current = fault_key
+                self._publish_faults(fault_key, faults)
                 if faults:
                     fault_text = ", ".join(str(f) for f in faults)
                     self.fault_signal.emit(f"[CURRENT] {fault_text}")
-                    self.log_signal.emit(f"Faults current: {fault_text}")
+                    self._log(f"Faults current: {fault_text}")
                 elif manual:
                     self.fault_signal.emit("[CURRENT] No faults")
         except Reset_Exception:
@@ -262,14 +402,14 @@ class ShouterWorker(QObject):
                 self.fault_signal.emit(f"[CURRENT] Error reading faults: {e}")
 
     def read_faults_latched(self) -> None:
-        if not self.is_connected:
+        if not self._can_run:
             return
         try:
             faults = self.cs.faults_latched
             if faults:
                 fault_text = ", ".join(str(f) for f in faults)
                 self.fault_signal.emit(f"[LATCHED] {fault_text}")
-                self.log_signal.emit(f"Faults latched: {fault_text}")
+                self._log(f"Faults latched: {fault_text}")
             else:
                 self.fault_signal.emit("[LATCHED] No latched faults")
         except Reset_Exception:
@@ -278,68 +418,85 @@ class ShouterWorker(QObject):
             self.fault_signal.emit(f"[LATCHED] Error reading faults: {e}")
 
     def clear_faults(self) -> None:
-        if not self.is_connected:
+        if not self._can_run:
             return
         try:
             self.cs.faults_current = 0
-            self._last_faults_current = None
+            self._publish_faults(None)
+            self._faults_dirty = True
             self.fault_signal.emit("[INFO] Faults cleared")
-            self.log_signal.emit("Faults cleared")
+            self._log("Faults cleared")
         except Reset_Exception:
             self._handle_reset()
         except Exception as e:
             self.fault_signal.emit(f"[INFO] Error clearing faults: {e}")
 
-    def read_arm_state(self) -> None:
-        if not self.is_connected or not self.cs or self.is_busy:
+    def poll_status(self) -> None:
+        """
+        Automatic status poll: arm state plus faults in as few round trips
+        as possible.
+
+        ``cs.state`` reports armed / disarmed / fault in one request, so
+        ``faults_current`` is only read as well when the device is in fault,
+        the last read still showed faults (to see them clear), the cache was
+        invalidated, or the last read is older than
+        ``FAULT_POLL_INTERVAL_MS``.
+        """
+        if not self._can_run:
             return
         try:
-            armed_value = self.cs.armed
-            armed_bool = bool(int(armed_value))
-            self._set_armed(armed_bool)
-            if armed_bool:
-                self.status_signal.emit("ARMADO (PELIGRO)")
-            else:
-                self.status_signal.emit("DESARMADO")
+            state = str(self.cs.state).strip().lower()
         except Reset_Exception:
             self._handle_reset()
+            return
         except Exception as e:
-            self.log_signal.emit(f"Error consultando estado ARM: {e}")
+            self._log(f"Error consultando estado ARM: {e}")
+            return
+        armed = state == "armed"
+        self._set_armed(armed)
+        self._set_status("ARMADO (PELIGRO)" if armed else "DESARMADO")
+        if (
+            state == "fault"
+            or self._faults_dirty
+            or self._last_faults_current
+            or time.monotonic() - self._faults_ts >= FAULT_POLL_INTERVAL_MS / 1000
+        ):
+            self.read_faults_current(False)
 
     # ------------------------------------------------------------------
     # Raw command execution (advanced / debug)
     # ------------------------------------------------------------------
     def send_serial_command(self, command: str) -> None:
-        if not self.is_connected:
-            self.log_signal.emit("Error: Dispositivo no conectado")
+        if not self._can_run:
+            self._log("Error: Dispositivo no conectado")
             return
         try:
             local_ns = {"cs": self.cs, "time": time}
             result = eval(command, local_ns)
             if result is not None:
-                self.log_signal.emit(f">>> {command}")
-                self.log_signal.emit(f"RX: {result}")
+                self._log(f">>> {command}")
+                self._log(f"RX: {result}")
             else:
-                self.log_signal.emit(f">>> {command} (OK)")
+                self._log(f">>> {command} (OK)")
         except SyntaxError:
             try:
                 local_ns = {"cs": self.cs, "time": time}
                 exec(command, local_ns)
-                self.log_signal.emit(f">>> {command} (OK)")
+                self._log(f">>> {command} (OK)")
             except Exception as e:
-                self.log_signal.emit(f"Error: {e}")
+                self._log(f"Error: {e}")
         except Exception as e:
-            self.log_signal.emit(f"Error: {e}")
+            self._log(f"Error: {e}")
 
     def execute_code(self, code: str) -> None:
-        if not self.is_connected:
-            self.log_signal.emit("Error: Dispositivo no conectado")
+        if not self._can_run:
+            self._log("Error: Dispositivo no conectado")
             return
         try:
             local_ns = {"cs": self.cs, "time": time, "Reset_Exception": Reset_Exception}
             exec(code, local_ns)
-            self.log_signal.emit("Código ejecutado correctamente")
+            self._log("Código ejecutado correctamente")
         except Reset_Exception:
             self._handle_reset()
         except Exception as e:
-            self.log_signal.emit(f"Error de ejecución: {e}")
+            self._log(f"Error de ejecución: {e}")
@@ -3,24 +3,65 @@ SweepWorker – QObject running on a dedicated QThread.
 
 Executes a parameter-sweep fault-injection campaign against a KW45 target
 using the ChipSHOUTER's external hardware trigger.  The worker communicates
-exclusively through Qt signals so it can run safely off the GUI thread.
+through Qt signals and a locked output queue (log lines and results, see
+``take_output()``) so it can run safely off the GUI thread.
 """
 
+import os
+import threading
 import time
+from collections import deque
+from itertools import product
+from typing import NamedTuple
 
 from PySide6.QtCore import QObject, Signal
 
 from chipshouter.com_tools import Reset_Exception
 
-from config import KW45_RESET_MARKER
+from config import (
+    KW45_RESET_MARKER_B,
+    SWEEP_ARM_CHARGE_DWELL_S,
+    SWEEP_ARM_SETTLE_TIMEOUT_S,
+)
+from utils.csv_export import SweepCsvWriter
+from utils.probe_limits import pw_limits_for_voltage
+from utils.serial_utils import LineBuffer
+
+# KW45 response framing (markers always start at column 0 of a line)
+_DATA_START = b"--- DATA_START ---"
+_DATA_END = b"--- DATA_END ---"
+
+_EXCHANGE_TIMEOUT_NS = 3_000_000_000  # START -> DATA_END budget
+
+# Post-arm settle: poll cs.state with exponential backoff (bounded by
+# config.SWEEP_ARM_SETTLE_TIMEOUT_S), then hold until at least
+# config.SWEEP_ARM_CHARGE_DWELL_S has passed since the arm write.
+_ARM_POLL_MIN_S = 0.005
+_ARM_POLL_MAX_S = 0.3
+
+# Pre-encoded KW45 commands
+_START_CMD = b"START\r\n"
+_MODE_CMDS = {m: f"MODE:{m}\r\n".encode() for m in ("1", "2", "3", "4")}
+
+
+class TargetResponse(NamedTuple):
+    """One parsed KW45 DATA block; fields not reported are left empty."""
+
+    key: str = ""
+    pt: str = ""
+    ct: str = ""
+    reset: bool = False
+
+
+_RESET_RESPONSE = TargetResponse(reset=True)
+_FIELD_INDEX = {b"KEY": 0, b"PT": 1, b"CT": 2}
 
 
 class SweepWorker(QObject):
     # --- outgoing signals ---
     progress_signal = Signal(int, int, str)  # current, total, info
-    result_signal = Signal(dict)
+    output_available = Signal()  # queue went empty -> non-empty; see take_output()
     sweep_finished = Signal(str)
-    log_signal = Signal(str)
 
     # --- internal trigger signal (queued connection across threads) ---
     _start_requested = Signal(object, object, dict)  # cs, serial_port, config
@@ -29,10 +70,19 @@ class SweepWorker(QObject):
         super().__init__()
         self._start_requested.connect(self.start_sweep)
         self.cs = None
-        self._stop_requested = False
+        self._stop = threading.Event()
         self.is_running = False
         self.results: list[dict] = []
+        self.coverage_note = ""  # set when the probe filter dropped grid points
         self._warned_no_trigger_offset = False
+        self._rx = LineBuffer()
+        self._resync = True  # flush stale RX before the next START
+        self._applied: dict[str, int] = {}  # last values written to the ChipSHOUTER
+        self._armed_at = 0.0  # monotonic time of the last successful arm write
+        # Log lines (str) and results (dict) in emission order
+        self._out_queue: deque[str | dict] = deque()
+        self._out_lock = threading.Lock()
+        self._out_pending = False
 
     # ------------------------------------------------------------------
     # Public API
@@ -42,19 +92,20 @@ class SweepWorker(QObject):
         Run a parameter sweep using the KW45 external-trigger workflow.
 
         *target_serial* is the already-open ``serial.Serial`` from the
-        Serial Terminal panel.
+        Serial Terminal panel.  If *config* has an ``autosave_path``, each
+        result is also appended to that CSV as soon as its point finishes.
         """
         self.cs = cs
-        self._stop_requested = False
+        self._stop.clear()
         self.is_running = True
         self.results = []
+        self.coverage_note = ""
         self.reset_count = 0
         self._warned_no_trigger_offset = False
+        self._applied = {}
 
         if not target_serial or not target_serial.is_open:
-            self.log_signal.emit(
-                "ERROR: Serial Terminal must be connected to the target board."
-            )
+            self._log("ERROR: Serial Terminal must be connected to the target board.")
             self.is_running = False
             self.sweep_finished.emit("ABORTED: No target serial connection.")
             return
@@ -65,43 +116,57 @@ class SweepWorker(QObject):
         axes = config.get("sweep_axes", {"voltage", "pulse_width", "delay"})
 
         voltages = (
-            list(
-                range(config["v_start"], config["v_end"] + 1, max(1, config["v_step"]))
-            )
+            range(config["v_start"], config["v_end"] + 1, max(1, config["v_step"]))
             if "voltage" in axes
-            else [config["v_start"]]
+            else (config["v_start"],)
         )
         pulse_widths = (
-            list(
-                range(
-                    config["pw_start"], config["pw_end"] + 1, max(1, config["pw_step"])
-                )
-            )
+            range(config["pw_start"], config["pw_end"] + 1, max(1, config["pw_step"]))
             if "pulse_width" in axes
-            else [config["pw_start"]]
+            else (config["pw_start"],)
         )
         if "delay" in axes:
-            delays = list(
-                range(
-                    config.get("delay_start", 0),
-                    config.get("delay_end", 0) + 1,
-                    max(1, config.get("delay_step", 1)),
-                )
+            delays = range(
+                config.get("delay_start", 0),
+                config.get("delay_end", 0) + 1,
+                max(1, config.get("delay_step", 1)),
             )
             if not delays:
-                delays = [0]
+                delays = (0,)
         else:
-            delays = [config.get("delay_start", 0)]
-
-        total = len(voltages) * len(pulse_widths) * len(delays)
+            delays = (config.get("delay_start", 0),)
+
+        # Drop (V, PW) pairs outside the probe's pulse-width envelope at that
+        # voltage; the ChipSHOUTER would reject or fault on them anyway.
+        probe = config.get("probe")
+        points = [
+            (v, pw)
+            for v, pw in product(voltages, pulse_widths)
+            if probe is None or self._pw_allowed(v, pw, probe)
+        ]
+        skipped = len(voltages) * len(pulse_widths) - len(points)
+
+        # Flat (V, PW, delay) list in sweep order; delay varies fastest.
+        grid = [(v, pw, d) for (v, pw), d in product(points, delays)]
+        total = len(grid)
+        dropped = skipped * len(delays)
+        if dropped:
+            self.coverage_note = (
+                f"{dropped} of {total + dropped} grid points not visited: "
+                f"{skipped} V/PW pairs outside the {probe} probe limits"
+            )
         n_pulses = config.get("pulses_per_point", 5)
         pulse_interval_ms = config.get("pulse_interval", 2000)
         mode = config.get("mode", "1")
 
-        self.log_signal.emit(
+        self._log(
             f"Sweep grid: {len(voltages)}V x {len(pulse_widths)}PW x {len(delays)}Delay "
             f"= {total} points, {n_pulses} pulses/point"
         )
+        if dropped:
+            self._log(f"Skipped: {self.coverage_note}")
+        self.progress_signal.emit(0, total, f"[0/{total}] Preparing sweep...")
+        csv_out = self._open_autosave(config.get("autosave_path"))
 
         # ---- Fixed params (set while disarmed) ----
         try:
@@ -109,13 +174,12 @@ class SweepWorker(QObject):
             self.cs.pulse.deadtime = config.get("deadtime", 10)
             self.cs.mute = 1
         except Exception as e:
-            self.log_signal.emit(f"Fixed param config error: {e}")
+            self._log(f"Fixed param config error: {e}")
 
         # ---- Initial clear faults ----
         try:
             self.cs.faults_current = 0
-            time.sleep(0.1)
-            self.log_signal.emit("Faults cleared")
+            self._log("Faults cleared")
         except Exception:
             pass
 
@@ -127,268 +191,427 @@ class SweepWorker(QObject):
             expected_ct = configured_expected_ct
             expected_ct_cmp = self._normalize_ct(expected_ct)
             self._setup_target_mode(ser, mode)
-            self.log_signal.emit(f"Using configured expected CT: {expected_ct}")
+            self._log(f"Using configured expected CT: {expected_ct}")
         else:
             expected_ct = self._setup_target_mode(ser, mode)
             expected_ct_cmp = self._normalize_ct(expected_ct)
             if not expected_ct_cmp:
-                self.log_signal.emit(
+                self._log(
                     "WARNING: Could not establish expected CT from target. "
                     "Will lock on first valid CT during sweep."
                 )
 
         step = 0
-        for v in voltages:
-            if self._stop_requested:
+        total_g = total_r = sensitive = 0  # running totals for the summary
+        for v, pw, delay_us in grid:
+            if self._stop.is_set():
                 break
-            for pw in pulse_widths:
-                if self._stop_requested:
-                    break
-                for delay_us in delays:
-                    if self._stop_requested:
-                        break
-                    step += 1
-
-                    # 1) Disarm before changing parameters
-                    self._safe_disarm()
-
-                    # 2) Set parameters (while disarmed)
-                    try:
-                        self.cs.voltage = v
-                        self.cs.pulse.width = pw
-                        if delay_us > 0:
-                            if hasattr(self.cs, "trigger") and hasattr(
-                                self.cs.trigger, "offset"
-                            ):
-                                self.cs.trigger.offset = delay_us
-                            else:
-                                if not self._warned_no_trigger_offset:
-                                    self._warned_no_trigger_offset = True
-                                    self.log_signal.emit(
-                                        "Trigger offset not supported by this ChipSHOUTER library. "
-                                        "Delay sweep is ignored."
-                                    )
-                        time.sleep(0.05)
-                    except Reset_Exception:
-                        self.log_signal.emit(f"ChipSHOUTER reset at V={v} PW={pw}")
-                        continue
-                    except Exception as e:
-                        self.log_signal.emit(f"Config error V={v} PW={pw}: {e}")
-                        continue
+            step += 1
 
-                    # 3) Clear faults & Arm
-                    if not self._try_clear_and_arm():
-                        self.log_signal.emit(f"Arm failed V={v} PW={pw}, skipping")
-                        continue
+            # 1) Disarm before changing parameters
+            self._safe_disarm()
 
-                    # Wait for capacitor charge after arm
-                    time.sleep(1.0)
+            # 2) Set parameters (while disarmed)
+            failure = ""
+            try:
+                self._configure_point(v, pw, delay_us)
+            except Reset_Exception:
+                failure = "ChipSHOUTER reset during config"
+            except Exception as e:
+                failure = f"Config error ({e})"
 
-                    # 4) Pulse loop
-                    glitch, error, normal, reset = 0, 0, 0, 0
-                    last_ct = ""
-                    glitch_cts: list[str] = []
+            # 3) Clear faults & Arm, then wait for the HV to settle
+            if not failure and not self._try_clear_and_arm():
+                failure = "Arm failed"
+            if not failure and not self._wait_until_armed(SWEEP_ARM_SETTLE_TIMEOUT_S):
+                if self._stop.is_set():
+                    break
+                # Fault reported, or still charging at the deadline
+                failure = f"Not armed within {SWEEP_ARM_SETTLE_TIMEOUT_S}s"
+
+            # 4) Pulse loop.  A point that could not be armed is not pulsed
+            # (that would count unglitched CTs as "normal"); it is recorded
+            # with every pulse as an error so it still shows in the results.
+            glitch, error, normal, reset = 0, 0, 0, 0
+            if failure:
+                self._log(
+                    f"{failure} at V={v} PW={pw} D={delay_us}us, "
+                    f"recorded as {n_pulses} errors"
+                )
+                error = n_pulses
+            last_ct = ""
+            glitch_cts: list[str] = []
+            glitch_bits: list[str] = []
 
-                    for pulse_idx in range(n_pulses):
-                        if self._stop_requested:
-                            break
+            for pulse_idx in range(0 if failure else n_pulses):
+                if self._stop.is_set():
+                    break
 
-                        if pulse_idx > 0 and pulse_interval_ms > 0:
-                            time.sleep(pulse_interval_ms / 1000.0)
+                if pulse_idx > 0 and pulse_interval_ms > 0:
+                    if self._stop.wait(pulse_interval_ms / 1000.0):
+                        break
 
-                        resp = self._target_exchange(ser)
+                resp = self._target_exchange(ser)
 
-                        if resp is None:
-                            error += 1
-                            continue
+                if resp is None:
+                    error += 1
+                    continue
 
-                        if resp.get("_reset"):
-                            reset += 1
-                            self.reset_count += 1
-                            self.log_signal.emit(
-                                f"KW45 RESET #{self.reset_count} at V={v} PW={pw} "
-                                f"D={delay_us}us pulse#{pulse_idx + 1}"
-                            )
-                            new_expected = self._setup_target_mode(ser, mode)
-                            if new_expected and not manual_expected:
-                                expected_ct = new_expected
-                                expected_ct_cmp = self._normalize_ct(expected_ct)
-                                self.log_signal.emit(
-                                    f"Expected CT refreshed after reset: {expected_ct}"
-                                )
-                            if not self._try_clear_and_arm():
-                                break
-                            continue
-
-                        ct = resp.get("CT", "")
-                        ct_cmp = self._normalize_ct(ct)
-                        if not ct_cmp:
-                            error += 1
-                            continue
-
-                        # If expected CT is not known yet, lock on the first valid CT.
-                        if not expected_ct_cmp:
-                            expected_ct = ct
-                            expected_ct_cmp = ct_cmp
-                            self.log_signal.emit(f"Expected CT locked: {expected_ct}")
-
-                        last_ct = ct
-                        if ct_cmp != expected_ct_cmp:
-                            glitch += 1
-                            glitch_cts.append(ct)
-                        else:
-                            normal += 1
-
-                    n_total = glitch + error + normal + reset
-                    result = {
-                        "voltage": v,
-                        "pulse_width": pw,
-                        "delay_us": delay_us,
-                        "glitches": glitch,
-                        "errors": error,
-                        "normal": normal,
-                        "resets": reset,
-                        "total": n_total,
-                        "baseline_ct": "",
-                        "glitch_cts": ";".join(glitch_cts),
-                        "last_ct": last_ct,
-                        "rate": f"{glitch / n_total * 100:.1f}%"
-                        if n_total > 0
-                        else "0%",
-                    }
-                    self.results.append(result)
-                    self.result_signal.emit(result)
-
-                    tag = (
-                        "GLITCH"
-                        if glitch > 0
-                        else "RESET"
-                        if reset > 0
-                        else "ERROR"
-                        if error > 0
-                        else "Normal"
-                    )
-                    self.progress_signal.emit(
-                        step,
-                        total,
-                        f"[{step}/{total}] V={v}V PW={pw}ns D={delay_us}us -> {tag} "
-                        f"(G:{glitch} R:{reset} E:{error} N:{normal})",
+                if resp.reset:
+                    reset += 1
+                    self.reset_count += 1
+                    self._log(
+                        f"KW45 RESET #{self.reset_count} at V={v} PW={pw} "
+                        f"D={delay_us}us pulse#{pulse_idx + 1}"
                     )
-                    time.sleep(0.05)
+                    new_expected = self._setup_target_mode(ser, mode)
+                    if new_expected and not manual_expected:
+                        expected_ct = new_expected
+                        expected_ct_cmp = self._normalize_ct(expected_ct)
+                        self._log(f"Expected CT refreshed after reset: {expected_ct}")
+                    if not self._try_clear_and_arm():
+                        break
+                    if not self._wait_until_armed(SWEEP_ARM_SETTLE_TIMEOUT_S):
+                        # Keep the pulses counted so far; stop this point.
+                        if not self._stop.is_set():
+                            self._log(
+                                f"Arm settle failed V={v} PW={pw} "
+                                f"D={delay_us}us after reset"
+                            )
+                        break
+                    continue
+
+                ct = resp.ct
+                ct_cmp = self._normalize_ct(ct)
+                if not ct_cmp:
+                    error += 1
+                    continue
+
+                # If expected CT is not known yet, lock on the first valid CT.
+                if not expected_ct_cmp:
+                    expected_ct = ct
+                    expected_ct_cmp = ct_cmp
+                    self._log(f"Expected CT locked: {expected_ct}")
+
+                last_ct = ct
+                if ct_cmp != expected_ct_cmp:
+                    glitch += 1
+                    glitch_cts.append(ct)
+                    glitch_bits.append(str(self._bit_flips(ct_cmp, expected_ct_cmp)))
+                else:
+                    normal += 1
+
+            n_total = glitch + error + normal + reset
+            result = {
+                "voltage": v,
+                "pulse_width": pw,
+                "delay_us": delay_us,
+                "glitches": glitch,
+                "errors": error,
+                "normal": normal,
+                "resets": reset,
+                "total": n_total,
+                "baseline_ct": "",
+                "glitch_cts": ";".join(glitch_cts),
+                "glitch_bits": ";".join(glitch_bits),
+                "last_ct": last_ct,
+                "rate": f"{glitch / n_total * 100:.1f}%" if n_total > 0 else "0%",
+            }
+            self.results.append(result)
+            self._push(result)
+            total_g += glitch
+            total_r += reset
+            sensitive += glitch > 0
+            if csv_out is not None:
+                try:
+                    csv_out.write(result)
+                except OSError as e:
+                    self._log(f"CSV auto-save stopped: {e}")
+                    csv_out.close()
+                    csv_out = None
+
+            tag = (
+                "GLITCH"
+                if glitch > 0
+                else "RESET"
+                if reset > 0
+                else "ERROR"
+                if error > 0
+                else "Normal"
+            )
+            self.progress_signal.emit(
+                step,
+                total,
+                f"[{step}/{total}] V={v}V PW={pw}ns D={delay_us}us -> {tag} "
+                f"(G:{glitch} R:{reset} E:{error} N:{normal})",
+            )
 
         # ---- Cleanup ----
         self._safe_disarm()
+        if csv_out is not None:
+            csv_out.close()
         self.is_running = False
 
-        total_g = sum(r["glitches"] for r in self.results)
-        total_r = sum(r["resets"] for r in self.results)
-        sensitive = len([r for r in self.results if r["glitches"] > 0])
-        prefix = "STOPPED" if self._stop_requested else "COMPLETE"
-        self.sweep_finished.emit(
+        prefix = "STOPPED" if self._stop.is_set() else "COMPLETE"
+        summary = (
             f"{prefix}: {step}/{total} points | "
             f"Glitches: {total_g} in {sensitive} points | Resets: {total_r}"
         )
+        if dropped:
+            summary += f" | Skipped (probe limits): {dropped}"
+        self.sweep_finished.emit(summary)
 
     def stop_sweep(self) -> None:
-        self._stop_requested = True
+        self._stop.set()
+
+    def take_output(self) -> list[str | dict]:
+        """
+        Return and clear everything queued since the last call (GUI thread).
+
+        Items are log lines (``str``) and point results (``dict``), in the
+        order the sweep produced them.
+        """
+        with self._out_lock:
+            items = list(self._out_queue)
+            self._out_queue.clear()
+            self._out_pending = False
+        return items
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _push(self, item: str | dict) -> None:
+        """Queue *item* for the GUI; signal only when the queue was empty."""
+        with self._out_lock:
+            self._out_queue.append(item)
+            notify = not self._out_pending
+            self._out_pending = True
+        if notify:
+            self.output_available.emit()
+
+    def _log(self, text: str) -> None:
+        self._push(text)
+
+    def _open_autosave(self, path: str | None) -> SweepCsvWriter | None:
+        """Create the auto-save CSV at *path*; log and return None on failure."""
+        if not path:
+            return None
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            notes = (self.coverage_note,) if self.coverage_note else ()
+            writer = SweepCsvWriter(path, notes)
+        except OSError as e:
+            self._log(f"CSV auto-save disabled: {e}")
+            return None
+        self._log(f"Auto-saving results to {os.path.abspath(path)}")
+        return writer
+
     def _setup_target_mode(self, ser, mode: str):
         """Send MODE:<n>, synchronize state, and return expected CT if available."""
         try:
             ser.reset_input_buffer()
-            ser.write(f"MODE:{mode}\r\n".encode())
+            ser.write(_MODE_CMDS.get(mode) or f"MODE:{mode}\r\n".encode())
             time.sleep(0.5)
-            ser.reset_input_buffer()
-            self.log_signal.emit(f"Target MODE:{mode} set")
+            self._resync = True
+            self._log(f"Target MODE:{mode} set")
 
             resp = self._target_exchange(ser)
-            if resp and not resp.get("_reset") and resp.get("CT"):
-                expected_ct = resp.get("CT", "")
-                self.log_signal.emit(f"Expected CT: {expected_ct}")
+            if resp and not resp.reset and resp.ct:
+                expected_ct = resp.ct
+                self._log(f"Expected CT: {expected_ct}")
                 return expected_ct
             return None
         except Exception as e:
-            self.log_signal.emit(f"Target mode setup error: {e}")
+            self._log(f"Target mode setup error: {e}")
             return None
 
-    def _target_exchange(self, ser) -> dict | None:
+    def _target_exchange(self, ser) -> TargetResponse | None:
         """
         Send START to KW45 and parse the DATA_START/DATA_END response.
 
-        Returns dict with parsed fields, ``{'_reset': True}`` on reset,
-        or ``None`` on error/timeout.
+        Returns a ``TargetResponse`` with the KEY/PT/CT fields, one with
+        ``reset=True`` on reset, or ``None`` on error/timeout.
+
+        Lines before DATA_START are ignored by the parser, so the input
+        buffer is only flushed after an exchange that did not end cleanly.
         """
         try:
-            ser.reset_input_buffer()
-            ser.write(b"START\r\n")
-            data = {}
+            rx = self._rx
+            if self._resync:
+                ser.reset_input_buffer()
+                rx.clear()
+                self._resync = False
+            ser.write(_START_CMD)
+            # Bind hot-loop lookups once per exchange.
+            fill, lines, now_ns = rx.fill, rx.lines, time.monotonic_ns
+            field_index = _FIELD_INDEX
+            fields = ["", "", ""]
+            got_field = False
             collecting = False
-            t0 = time.time()
-            while (time.time() - t0) < 3.0:
-                raw = ser.readline()
-                if not raw:
+            deadline = now_ns() + _EXCHANGE_TIMEOUT_NS
+            while now_ns() < deadline:
+                if not fill(ser):
                     continue
-                line = raw.decode("utf-8", errors="ignore").strip()
-                if not line:
-                    continue
-
-                if KW45_RESET_MARKER in line:
-                    return {"_reset": True}
+                for raw in lines():
+                    # Lines are parsed as bytes; only field values are decoded.
+                    if b"ERROR:" in raw:
+                        self._resync = True
+                        return None
+                    if KW45_RESET_MARKER_B in raw:
+                        self._resync = True
+                        return _RESET_RESPONSE
+                    line = raw.rstrip(b"\r")
+                    if not line:
+                        continue
 
-                if "--- DATA_START ---" in line:
-                    collecting = True
-                    continue
-                if "--- DATA_END ---" in line:
-                    return data
-                if "ERROR:" in line:
-                    return None
-                if collecting and ":" in line:
-                    parts = line.split(":", 1)
-                    if len(parts) == 2:
-                        data[parts[0].strip()] = parts[1].strip()
-            return data if data else None
+                    if line.startswith(_DATA_START):
+                        collecting = True
+                        continue
+                    if line.startswith(_DATA_END):
+                        return TargetResponse(*fields)
+                    if collecting:
+                        key, sep, value = line.partition(b":")
+                        idx = field_index.get(key.strip()) if sep else None
+                        if idx is not None:
+                            fields[idx] = value.strip().decode("ascii", errors="ignore")
+                            got_field = True
+            self._resync = True
+            return TargetResponse(*fields) if got_field else None
         except Exception:
+            self._resync = True
             return None
 
     @staticmethod
-    def _normalize_ct(value) -> str:
-        """Normalize CT string for robust comparisons."""
-        if value is None:
-            return ""
-        return str(value).strip().replace(" ", "").lower()
+    def _normalize_ct(value) -> bytes:
+        """
+        Normalize a CT hex string to raw bytes for robust comparisons.
+
+        Case and spacing no longer matter, and a 16-byte compare replaces a
+        32-character string compare.  Non-hex values fall back to their
+        lower-cased text so they still compare consistently.
+        """
+        if not value:
+            return b""
+        text = str(value).strip().replace(" ", "")
+        try:
+            return bytes.fromhex(text)
+        except ValueError:
+            return text.lower().encode()
+
+    @staticmethod
+    def _pw_allowed(voltage: int, pw: int, probe: str) -> bool:
+        pw_min, pw_max = pw_limits_for_voltage(voltage, probe)
+        return pw_min <= pw <= pw_max
+
+    @staticmethod
+    def _bit_flips(ct: bytes, expected: bytes) -> int:
+        """Return the Hamming distance in bits between two normalized CTs."""
+        diff = int.from_bytes(ct, "big") ^ int.from_bytes(expected, "big")
+        return diff.bit_count()
+
+    def _configure_point(self, v: int, pw: int, delay_us: int) -> None:
+        """
+        Write the per-point parameters, skipping values already applied.
+
+        Each ChipSHOUTER attribute write is a blocking request/ACK round
+        trip, and along the inner delay axis voltage and pulse width do not
+        change, so only the parameters that differ from the previous point
+        are sent.  The cache is dropped if the device resets.
+        """
+        cs, applied = self.cs, self._applied
+        try:
+            if applied.get("voltage") != v:
+                cs.voltage = v
+                applied["voltage"] = v
+            if applied.get("pulse_width") != pw:
+                cs.pulse.width = pw
+                applied["pulse_width"] = pw
+            if delay_us > 0 and applied.get("delay_us") != delay_us:
+                if hasattr(cs, "trigger") and hasattr(cs.trigger, "offset"):
+                    cs.trigger.offset = delay_us
+                    applied["delay_us"] = delay_us
+                elif not self._warned_no_trigger_offset:
+                    self._warned_no_trigger_offset = True
+                    self._log(
+                        "Trigger offset not supported by this ChipSHOUTER library. "
+                        "Delay sweep is ignored."
+                    )
+        except Exception:
+            # Reset or failed write: device state unknown, resend everything.
+            applied.clear()
+            raise
+
+    def _wait_until_armed(self, timeout: float) -> bool:
+        """
+        Poll ``cs.state`` until the ChipSHOUTER reports ``armed``, then
+        hold until the HV has had ``SWEEP_ARM_CHARGE_DWELL_S`` to charge.
+
+        ``armed`` is reported as soon as the arm command is accepted, before
+        the capacitors are charged, so the state alone does not make the
+        first pulse safe to count.  The poll interval starts at
+        ``_ARM_POLL_MIN_S`` and doubles up to ``_ARM_POLL_MAX_S``.  Returns
+        True once armed and charged; False on fault, stop request, or after
+        *timeout* seconds without ``armed``.
+        """
+        deadline = time.monotonic() + timeout
+        interval = _ARM_POLL_MIN_S
+        while not self._stop.is_set():
+            try:
+                state = str(self.cs.state).strip().lower()
+            except Exception:
+                state = ""
+            if state == "armed":
+                dwell = self._armed_at + SWEEP_ARM_CHARGE_DWELL_S - time.monotonic()
+                return dwell <= 0 or not self._stop.wait(dwell)
+            if state == "fault":
+                return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._stop.wait(min(interval, remaining))
+            interval = min(interval * 2, _ARM_POLL_MAX_S)
+        return False
 
     def _safe_disarm(self) -> None:
-        """Disarm ChipSHOUTER with retry."""
+        """
+        Disarm ChipSHOUTER with retry.
+
+        The ``armed`` write returns once the device has ACKed it, and only
+        parameter writes follow before the next arm, whose charge dwell
+        (see ``_wait_until_armed``) covers the HV settling; only failed
+        attempts back off.
+        """
         for _ in range(3):
             try:
                 if self.cs:
                     self.cs.armed = 0
-                    time.sleep(0.15)
                     return
             except Exception:
                 time.sleep(0.1)
 
     def _try_clear_and_arm(self) -> bool:
-        """Clear faults then arm.  Returns True on success."""
+        """
+        Clear faults then arm.  Returns True on success.
+
+        Both writes are ACKed by the device; charge-up is awaited by the
+        caller through ``_wait_until_armed``, timed from the arm write.
+        """
         for attempt in range(3):
             try:
                 self.cs.faults_current = 0
-                time.sleep(0.1)
                 self.cs.armed = 1
-                time.sleep(0.2)
+                self._armed_at = time.monotonic()
                 return True
             except Reset_Exception:
-                self.log_signal.emit("ChipSHOUTER reset during arm")
+                self._applied.clear()
+                self._log("ChipSHOUTER reset during arm")
                 return False
             except Exception as e:
                 if attempt < 2:
-                    self.log_signal.emit(
-                        f"Arm attempt {attempt + 1} failed: {e}, retrying..."
-                    )
+                    self._log(f"Arm attempt {attempt + 1} failed: {e}, retrying...")
                     time.sleep(0.3)
                 else:
-                    self.log_signal.emit(f"Arm failed after 3 attempts: {e}")
+                    self._log(f"Arm failed after 3 attempts: {e}")
         return False